@@ -8,30 +8,9 @@ Usage:
     python run_post.py --config configs/brno.yaml
 """
 
-import argparse
-import asyncio
-
-from src.config import init_config
-from src.pipeline import post_flow
-
-
-async def main() -> None:
-    parser = argparse.ArgumentParser(description="Party Scraper — Post")
-    parser.add_argument("--config", required=True, help="Path to city YAML config file")
-    args = parser.parse_args()
-
-    cfg = init_config(args.config)
-
-    print("\n" + "=" * 60)
-    print(f"  Party Scraper — Post ({cfg.display_name})")
-    print("=" * 60 + "\n")
-
-    await post_flow()
-
-    print("\n" + "=" * 60)
-    print("  Post flow complete!")
-    print("=" * 60 + "\n")
+import sys
 
+from src.cli import main
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main(["post", *sys.argv[1:]])
@@ -4,187 +4,410 @@ Replicates the /scrape-batch-stream logic from the backend.
 Reused from src/scraper.py
 """
 import asyncio
+import atexit
 import json
 import logging
 import os
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener
+from string import Template
 from typing import Optional, Dict, Any, List
+from urllib.parse import urlparse
 
 from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, CacheMode
 
+from . import scrape_cache
+from .jsonio import dump_json
 from .models import EventDetail
-from .extractor import extract_event_detail
+from .extractor import extract_event_detail_async
 from .url_parser import parse_url_config
 
-logging.basicConfig(
-    filename='scraper_debug.log', level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s', encoding='utf-8', filemode='w'
-)
 
+_logging_initialized = False
 
-async def process_event(crawler: AsyncWebCrawler, url: str, known_date: Optional[str] = None) -> Optional[EventDetail]:
+
+def _setup_logging() -> None:
+    """Route log records through a queue so coroutines never block on disk.
+
+    The QueueListener drains records to the file on its own thread; the
+    handlers attached to the root logger only do an in-memory put.
+    Called lazily from `process_all_events` so merely importing this
+    module (e.g. via src.pipeline) doesn't truncate scraper_debug.log.
     """
-    Process a single event URL: crawl the page and extract details via Gemini.
+    global _logging_initialized
+    if _logging_initialized:
+        return
+    _logging_initialized = True
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    file_handler = logging.FileHandler(
+        'scraper_debug.log', mode='w', encoding='utf-8')
+    file_handler.setFormatter(
+        logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+
+    listener = QueueListener(log_queue, file_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(QueueHandler(log_queue))
+
+
+# ── action -> JS translation table ───────────────────────────────────────
+# One template function per action type, built once at import. Unknown or
+# incomplete actions translate to None and are skipped.
+
+# Single TreeWalker pass over text nodes: each node is visited once and we
+# stop at the first match, instead of calling the recursive textContent on
+# every element.
+_CLICK_TEXT_TEMPLATE = Template("""(() => {
+    let walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+    let node;
+    while ((node = walker.nextNode())) {
+        if (node.nodeValue && node.nodeValue.includes($text)) {
+            if (node.parentElement) node.parentElement.click();
+            break;
+        }
+    }
+})();""")
+
+
+def _wait_js(action: dict) -> Optional[str]:
+    duration = action.get("duration", 1)
+    return f"await new Promise(r => setTimeout(r, {duration * 1000}));"
+
+
+def _click_js(action: dict) -> Optional[str]:
+    selector = action.get("selector")
+    if not selector:
+        return None
+    return (
+        f"(() => {{ let el = document.querySelector('{selector}'); if(el) el.click(); }})();"
+    )
 
-    Args:
-        crawler: An active AsyncWebCrawler instance.
-        url: The event page URL.
-        known_date: Optional pre-known date to backfill if extraction misses it.
+
+def _click_text_js(action: dict) -> Optional[str]:
+    text = action.get("text")
+    if not text:
+        return None
+    return _CLICK_TEXT_TEMPLATE.substitute(text=json.dumps(text))
+
+
+def _scroll_js(action: dict) -> Optional[str]:
+    amount = action.get("amount", 1000)
+    if action.get("direction", "down") == "down":
+        return f"window.scrollBy(0, {amount});"
+    return f"window.scrollBy(0, -{amount});"
+
+
+_ACTION_TEMPLATES = {
+    "wait": _wait_js,
+    "click": _click_js,
+    "click_text": _click_text_js,
+    "scroll": _scroll_js,
+}
+
+
+# ── extraction JS templates ──────────────────────────────────────────────
+# Frozen once at import; _compile_scraping_js only substitutes the JSON-encoded
+# selectors, so no multi-KB f-string is reassembled per compile.
+
+# All text fields are extracted in one JS call that returns a field -> value
+# object, so the number of CDP round trips stays constant regardless of how
+# many selectors a config defines.
+_TEXT_FIELDS_JS_TEMPLATE = Template("""
+return (() => {
+    let fields = $fields;
+    let out = {};
+    for (let [field, sel] of Object.entries(fields)) {
+        let el = document.querySelector(sel);
+        out[field] = el ? el.textContent.trim() : null;
+    }
+    return out;
+})();
+""")
+
+# Poll for the image instead of sleeping a fixed 2s: resolve as soon as the
+# element has a src/background, 2s cap as the worst case.
+_IMG_POLL_JS_TEMPLATE = Template("""await new Promise((resolve) => {
+    let start = Date.now();
+    (function poll() {
+        let el = document.querySelector($selector);
+        if (el && (el.src || getComputedStyle(el).backgroundImage !== 'none')) return resolve();
+        if (Date.now() - start > 2000) return resolve();
+        requestAnimationFrame(poll);
+    })();
+});""")
+
+_IMG_EXTRACT_JS_TEMPLATE = Template(r"""
+return (() => {
+    let elements = document.querySelectorAll($selector);
+    let candidates = [];
+    for (let el of elements) {
+        let url = null;
+
+        // 1. Try IMG tag
+        if (el.tagName === 'IMG') {
+            url = el.src || el.getAttribute('data-src');
+        } else {
+            // 2. Try window.getComputedStyle
+            let style = window.getComputedStyle(el);
+            let bg = style.backgroundImage;
+
+            // 3. Fallback: Check inline style attribute directly if computed failed
+            if (!bg || bg === 'none') {
+                bg = el.style.backgroundImage || el.getAttribute('style') || '';
+            }
+
+            if (bg && bg !== 'none') {
+                let match = bg.match(/url\(["']?(.*?)["']?\)/);
+                if (match) url = match[1];
+            }
+
+            // 4. Fallback: Data attributes
+            if (!url) url = el.getAttribute('data-src') || el.getAttribute('data-original');
+        }
+
+        if (url) {
+            // Clean up the URL string
+            url = url.replace(/&quot;/g, '').replace(/&amp;/g, '&').replace(/"/g, '');
+            try { candidates.push(new URL(url, document.baseURI).href); } catch(e) {}
+        }
+    }
+    let best = null;
+    if (candidates.length > 0) {
+        best = candidates.find(u => u.includes('1200') || u.includes('large') || u.includes('/Event/'))
+            || candidates.sort((a, b) => b.length - a.length)[0];
+    }
+    return {image_url: best};
+})();
+""")
+
+
+def _compile_scraping_js(scraping_config) -> tuple:
+    """
+    Build the JS code blocks, wait_for condition, and extraction field list
+    for a scraping config. Pure function of the config, so results are
+    memoized per config key (selectors/actions are per-host, not per-URL).
 
     Returns:
-        EventDetail or None on failure.
+        Tuple of (js_code_blocks, wait_for, extraction_fields).
     """
-    logging.info(f"Crawling URL: {url}")
-    scraping_config = parse_url_config(url)
     actions_data = scraping_config.actions
     selectors = scraping_config.selectors
     js_code_blocks = []
 
     if actions_data:
-        logging.info(f"Using custom actions: {actions_data}")
+        logging.info("Using custom actions: %s", actions_data)
         for action in actions_data:
-            a_type = action.get("type")
-            if a_type == "wait":
-                duration = action.get("duration", 1)
-                js_code_blocks.append(
-                    f"await new Promise(r => setTimeout(r, {duration * 1000}));")
-            elif a_type == "click":
-                selector = action.get("selector")
-                if selector:
-                    js_code_blocks.append(
-                        f"(() => {{ let el = document.querySelector('{selector}'); if(el) el.click(); }})();"
-                    )
-            elif a_type == "click_text":
-                text = action.get("text")
-                if text:
-                    js_code_blocks.append(
-                        f"""(() => {{
-                            let elements = Array.from(document.querySelectorAll('*'));
-                            let target = elements.find(el => el.textContent && el.textContent.includes('{text}') && !el.querySelector('*'));
-                            if (!target) {{ target = elements.find(el => el.textContent && el.textContent.includes('{text}')); }}
-                            if (target) target.click();
-                        }})();"""
-                    )
-            elif a_type == "scroll":
-                direction = action.get("direction", "down")
-                amount = action.get("amount", 1000)
-                if direction == "down":
-                    js_code_blocks.append(f"window.scrollBy(0, {amount});")
-                else:
-                    js_code_blocks.append(f"window.scrollBy(0, -{amount});")
+            template_fn = _ACTION_TEMPLATES.get(action.get("type"))
+            js = template_fn(action) if template_fn else None
+            if js:
+                js_code_blocks.append(js)
 
     wait_for = None
     extraction_fields = []
+    text_selectors = {}
+    image_selector = None
 
     for field_name, selector in selectors.items():
         if not selector:
             continue
         extraction_fields.append(field_name)
         if field_name == "image_url":
-            if not actions_data:
-                wait_for = f"css:{selector}"
-            js_code_blocks.append(
-                "await new Promise(r => setTimeout(r, 2000));")
-            extract_image_js = rf"""
-            return (() => {{
-                let elements = document.querySelectorAll({json.dumps(selector)});
-                let candidates = [];
-                for (let el of elements) {{
-                    let url = null;
-
-                    // 1. Try IMG tag
-                    if (el.tagName === 'IMG') {{
-                        url = el.src || el.getAttribute('data-src');
-                    }} else {{
-                        // 2. Try window.getComputedStyle
-                        let style = window.getComputedStyle(el);
-                        let bg = style.backgroundImage;
-
-                        // 3. Fallback: Check inline style attribute directly if computed failed
-                        if (!bg || bg === 'none') {{
-                            bg = el.style.backgroundImage || el.getAttribute('style') || '';
-                        }}
-
-                        if (bg && bg !== 'none') {{
-                            let match = bg.match(/url\(["']?(.*?)["']?\)/);
-                            if (match) url = match[1];
-                        }}
-
-                        // 4. Fallback: Data attributes
-                        if (!url) url = el.getAttribute('data-src') || el.getAttribute('data-original');
-                    }}
-
-                    if (url) {{
-                        // Clean up the URL string
-                        url = url.replace(/&quot;/g, '').replace(/&amp;/g, '&').replace(/"/g, '');
-                        try {{ candidates.push(new URL(url, document.baseURI).href); }} catch(e) {{}}
-                    }}
-                }}
-                if (candidates.length === 0) return null;
-                let best = candidates.find(u => u.includes('1200') || u.includes('large') || u.includes('/Event/'));
-                if (best) return best;
-                return candidates.sort((a, b) => b.length - a.length)[0];
-            }})();
-            """
-
-            js_code_blocks.append(extract_image_js)
+            image_selector = selector
         else:
-            extract_text_js = rf"""
-            return (() => {{
-                let el = document.querySelector({json.dumps(selector)});
-                return el ? el.textContent.trim() : null;
-            }})();
-            """
-            js_code_blocks.append(extract_text_js)
+            text_selectors[field_name] = selector
+
+    if text_selectors:
+        js_code_blocks.append(
+            _TEXT_FIELDS_JS_TEMPLATE.substitute(fields=json.dumps(text_selectors)))
+
+    if image_selector:
+        if not actions_data:
+            wait_for = f"css:{image_selector}"
+        selector_json = json.dumps(image_selector)
+        js_code_blocks.append(
+            _IMG_POLL_JS_TEMPLATE.substitute(selector=selector_json))
+        js_code_blocks.append(
+            _IMG_EXTRACT_JS_TEMPLATE.substitute(selector=selector_json))
+
+    return js_code_blocks, wait_for, extraction_fields
+
+
+_JS_CACHE: Dict[str, tuple] = {}
+
+
+def _get_compiled_js(scraping_config) -> tuple:
+    """Return the memoized `_compile_scraping_js` result for this config."""
+    key = scraping_config.cache_key
+    cached = _JS_CACHE.get(key)
+    if cached is None:
+        cached = _compile_scraping_js(scraping_config)
+        _JS_CACHE[key] = cached
+    return cached
+
+
+async def process_event(crawler: AsyncWebCrawler, url: str, known_date: Optional[str] = None) -> Optional[EventDetail]:
+    """
+    Process a single event URL: crawl the page and extract details via Gemini.
+
+    Args:
+        crawler: An active AsyncWebCrawler instance.
+        url: The event page URL.
+        known_date: Optional pre-known date to backfill if extraction misses it.
+
+    Returns:
+        EventDetail or None on failure.
+    """
+    scraping_config = parse_url_config(url)
+
+    # Cache hit: skip both the crawl and the Gemini call entirely
+    cache_key = scrape_cache.make_key(
+        url, scraping_config.cache_key, known_date or "")
+    cached_detail = scrape_cache.get(cache_key)
+    if cached_detail is not None:
+        logging.info("Cache hit for %s", url)
+        return EventDetail(**cached_detail)
+
+    logging.info("Crawling URL: %s", url)
+    js_code_blocks, wait_for, extraction_fields = _get_compiled_js(scraping_config)
 
     config = CrawlerRunConfig(
         js_code=js_code_blocks if js_code_blocks else [],
         wait_for=wait_for if wait_for else "",
-        cache_mode=CacheMode.BYPASS,
-        session_id="session_1",
+        # Plain GET passes (no JS actions to replay) can reuse crawl4ai's
+        # local page cache; pages that need clicks/waits still bypass it.
+        cache_mode=CacheMode.ENABLED if not js_code_blocks else CacheMode.BYPASS,
+        # One session per host so crawl4ai reuses the same browser context
+        # (and its TCP/TLS connections) for all events on that venue.
+        session_id=urlparse(url).netloc or "session_default",
         user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     )
 
     result: Any = await crawler.arun(url=url, config=config)
 
-    if not result.markdown:
-        logging.warning(f"No content found for {url}")
+    # Keep only the pieces we need and drop the crawl result itself — it
+    # holds the full rendered page, which adds up fast with N tasks in
+    # flight under the concurrency pool.
+    markdown = result.markdown
+    js_result = getattr(result, 'js_execution_result', None)
+    del result
+
+    if not markdown:
+        logging.warning("No content found for %s", url)
         return None
 
     logging.info(
-        f"Extracted content length: {len(result.markdown)} chars. Sending to Gemini...")
-    event_detail = extract_event_detail(result.markdown)
-
-    if hasattr(result, 'js_execution_result') and result.js_execution_result:
-        logging.info(f"JS execution result: {result.js_execution_result}")
-
-    if event_detail and hasattr(result, 'js_execution_result') and result.js_execution_result and extraction_fields:
-        results_list = result.js_execution_result.get("results", [])
-        if results_list and len(results_list) > 0:
-            string_results = [r for r in results_list if isinstance(r, str)]
-            for idx, field_name in enumerate(extraction_fields):
-                if idx < len(string_results) and string_results[idx]:
-                    extracted_value = string_results[idx]
-                    logging.info(
-                        f"Overriding {field_name} with manual extraction: "
-                        f"{extracted_value[:100] if len(extracted_value) > 100 else extracted_value}..."
-                    )
-                    setattr(event_detail, field_name, extracted_value)
+        "Extracted content length: %d chars. Sending to Gemini...", len(markdown))
+    # Async Gemini call — many extractions stay in flight on the event loop
+    # without burning a worker thread each, so crawls keep progressing.
+    event_detail = await extract_event_detail_async(markdown)
+
+    if js_result:
+        logging.info("JS execution result: %s", js_result)
+
+    if event_detail and js_result and extraction_fields:
+        results_list = js_result.get("results", [])
+        known_fields = frozenset(extraction_fields)
+        # The extraction blocks return field -> value objects, so overrides
+        # are matched by name rather than position.
+        for block_result in results_list:
+            if not isinstance(block_result, dict):
+                continue
+            for field_name, extracted_value in block_result.items():
+                if field_name not in known_fields:
+                    continue
+                if not isinstance(extracted_value, str) or not extracted_value:
+                    continue
+                logging.info(
+                    "Overriding %s with manual extraction: %s...",
+                    field_name, extracted_value[:100],
+                )
+                setattr(event_detail, field_name, extracted_value)
 
     if event_detail:
-        logging.info(f"Successfully extracted: {event_detail.title}")
+        logging.info("Successfully extracted: %s", event_detail.title)
         if not event_detail.date and known_date:
-            logging.info(f"Backfilling missing date with: {known_date}")
+            logging.info("Backfilling missing date with: %s", known_date)
             event_detail.date = known_date
+        scrape_cache.put(cache_key, markdown, event_detail.model_dump())
         return event_detail
     else:
-        logging.error(f"Failed to extract details for {url}")
+        logging.error("Failed to extract details for %s", url)
         return None
 
 
+# How many events are crawled concurrently. The workload is network-bound
+# (crawl4ai + Gemini round trips dominate), so a handful of parallel tasks
+# gives near-linear speedup without flooding any single venue.
+CONCURRENCY = int(os.getenv("SCRAPER_CONCURRENCY", "10"))
+
+# Events of one host share a crawl4ai session (one browser page), and
+# concurrent page.goto calls on the same page abort each other's
+# navigations — so same-host crawls must not overlap. Kept configurable,
+# but >1 is only safe if session sharing is turned off.
+HOST_CONCURRENCY = int(os.getenv("SCRAPER_HOST_CONCURRENCY", "1"))
+
+# Incremental saves are throttled: flush at most once per FLUSH_INTERVAL
+# seconds or after FLUSH_EVERY new events, whichever comes first. A final
+# unconditional flush always happens at the end of the run.
+FLUSH_INTERVAL = 5.0
+FLUSH_EVERY = 10
+
+
+def _atomic_write_json(output_path: str, results: Dict[str, list]) -> None:
+    """Serialize *results* to a temp file and atomically swap it into place."""
+    tmp_path = output_path + ".tmp"
+    dump_json(results, tmp_path)
+    os.replace(tmp_path, output_path)
+
+
+async def _process_one(
+    semaphore: asyncio.Semaphore,
+    host_semaphore: asyncio.Semaphore,
+    crawler: AsyncWebCrawler,
+    venue: str,
+    event: dict,
+) -> tuple:
+    """Run one bounded `process_event` call; return (venue, outcome dict).
+
+    The host semaphore is taken first so a venue's queued events wait on
+    each other (they share a browser session) without occupying a slot in
+    the global pool.
+    """
+    url = event.get("url")
+    date = event.get("date")
+
+    async with host_semaphore, semaphore:
+        print(f"  [{venue}] Processing: {url}")
+        try:
+            detail = await asyncio.wait_for(
+                process_event(crawler, url, date or ""),
+                timeout=60.0
+            )
+            if detail:
+                if not detail.place:
+                    detail.place = venue
+                print(f"    -> Extracted: {detail.title}")
+                return venue, detail.model_dump()
+            print(f"    -> FAILED: No data extracted ({url})")
+            return venue, {"url": url, "error": "Extraction failed"}
+        except asyncio.TimeoutError:
+            print(f"    -> TIMEOUT ({url})")
+            return venue, {"url": url, "error": "Timeout after 60s"}
+        except Exception as e:
+            print(f"    -> ERROR: {e} ({url})")
+            return venue, {"url": url, "error": str(e)}
+
+
 async def process_all_events(input_data: Dict[str, List[dict]], output_path: str) -> Dict[str, list]:
     """
     Process all events for all venues using crawl4ai + Gemini extraction.
-    Saves results incrementally to output_path.
+    Events are crawled concurrently (bounded by CONCURRENCY) and results
+    are saved incrementally to output_path.
 
     Args:
         input_data: Dict mapping venue name to list of {url, date} dicts.
@@ -193,54 +416,55 @@ async def process_all_events(input_data: Dict[str, List[dict]], output_path: str
     Returns:
         Dict mapping venue name to list of EventDetail dicts.
     """
-    results: Dict[str, list] = {}
+    _setup_logging()
+
+    results: Dict[str, list] = {venue: [] for venue in input_data}
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def _host_semaphore(url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc
+        sem = host_semaphores.get(host)
+        if sem is None:
+            sem = host_semaphores[host] = asyncio.Semaphore(HOST_CONCURRENCY)
+        return sem
+
+    last_flush = time.monotonic()
+    unflushed = 0
 
     async with AsyncWebCrawler(verbose=True) as crawler:
         total_events = sum(len(events) for events in input_data.values())
-        processed_count = 0
-
-        for venue, events in input_data.items():
-            print(f"\n{'='*40}")
-            print(f"  AI Processing: {venue} ({len(events)} events)")
-            print(f"{'='*40}")
-
-            venue_results = []
-            for event in events:
-                url = event.get("url")
-                date = event.get("date")
-                if not url:
-                    continue
-
-                processed_count += 1
-                print(f"  [{processed_count}/{total_events}] Processing: {url}")
-
-                try:
-                    detail = await asyncio.wait_for(
-                        process_event(crawler, url, date or ""),
-                        timeout=60.0
-                    )
-                    if detail:
-                        if not detail.place:
-                            detail.place = venue
-                        venue_results.append(detail.model_dump())
-                        print(f"    -> Extracted: {detail.title}")
-                    else:
-                        venue_results.append(
-                            {"url": url, "error": "Extraction failed"})
-                        print(f"    -> FAILED: No data extracted")
-                except asyncio.TimeoutError:
-                    venue_results.append(
-                        {"url": url, "error": "Timeout after 60s"})
-                    print(f"    -> TIMEOUT")
-                except Exception as e:
-                    venue_results.append({"url": url, "error": str(e)})
-                    print(f"    -> ERROR: {e}")
-
-            results[venue] = venue_results
-
-            # Save incrementally
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"[AI Scraper] Processing {total_events} events "
+              f"(concurrency={CONCURRENCY})")
+
+        # One bounded pool across all venues: a slow venue no longer holds
+        # back output for the others, and the first results hit disk after
+        # a single crawl instead of a full venue batch.
+        tasks = [
+            asyncio.create_task(_process_one(
+                semaphore, _host_semaphore(event["url"]), crawler, venue, event))
+            for venue, events in input_data.items()
+            for event in events
+            if event.get("url")
+        ]
+
+        done_count = 0
+        for fut in asyncio.as_completed(tasks):
+            venue, outcome = await fut
+            results[venue].append(outcome)
+            done_count += 1
+            print(f"  [{done_count}/{len(tasks)}] done ({venue})")
+
+            # Save incrementally, throttled and off the event loop
+            unflushed += 1
+            now = time.monotonic()
+            if unflushed >= FLUSH_EVERY or now - last_flush >= FLUSH_INTERVAL:
+                await asyncio.to_thread(_atomic_write_json, output_path, results)
+                last_flush = now
+                unflushed = 0
+
+        # Final flush so the file always holds the complete result set
+        await asyncio.to_thread(_atomic_write_json, output_path, results)
 
     print(f"\n[AI Scraper] All done! Results saved to: {output_path}")
     return results
@@ -0,0 +1,192 @@
+"""
+Unified CLI for the party scraper.
+
+One argparse parser with subcommands replaces the ``--config`` boilerplate
+that every ``run_*.py`` wrapper used to re-declare. The wrappers are kept
+as thin shims for backwards compatibility; the canonical invocation is:
+
+    python -m src.cli <command> --config configs/brno.yaml
+
+Commands: setup, fetch, process, generate-images, review, morning, post, full.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+from typing import Optional
+
+from . import loop  # noqa: F401 — installs uvloop when available
+from .config import CityConfig, init_config
+
+
+def _banner(text: str) -> None:
+    print("\n" + "=" * 60)
+    print(f"  {text}")
+    print("=" * 60 + "\n")
+
+
+def cmd_setup(cfg: CityConfig) -> None:
+    """Verify the project setup (packages, Playwright, .env)."""
+    from .pipeline import PROJECT_ROOT, run_setup_step
+
+    print(f"\n[STEP 1] Checking setup for {cfg.display_name}...\n")
+    success = run_setup_step()
+    if success:
+        print("[STEP 1] Setup check passed")
+    else:
+        print("[STEP 1] Setup reported issues but you can continue")
+    print(f"Project root: {PROJECT_ROOT}")
+
+
+async def cmd_fetch(cfg: CityConfig) -> None:
+    """Run the fetch-and-parse stage and write events to disk."""
+    from .pipeline import build_today_events, fetch_and_parse_events
+
+    print(f"\n[STEP 2] Fetching and parsing HTML for {cfg.display_name}...\n")
+    fetched_events = await fetch_and_parse_events()
+
+    total_events = sum(len(events) for events in fetched_events.values())
+    print(f"[STEP 2] Parsed {total_events} events from {len(fetched_events)} venues")
+    upcoming = build_today_events(fetched_events)
+    print(f"[STEP 2] {sum(len(events) for events in upcoming.values())} of them happen today")
+
+
+async def cmd_process(cfg: CityConfig) -> None:
+    """Process today's events with AI and cache the detailed results."""
+    from .pipeline import (
+        build_today_events,
+        load_fetched_events,
+        process_today_events,
+    )
+
+    print("\n[STEP 3] Loading fetched events for AI processing...\n")
+    try:
+        fetched_events = load_fetched_events()
+    except FileNotFoundError as exc:
+        print("[STEP 3] Cannot load fetched events. Run the fetch step first.")
+        print(exc)
+        return
+    today_events = build_today_events(fetched_events)
+
+    today_total = sum(len(events) for events in today_events.values())
+    if today_total == 0:
+        print("[STEP 3] No events scheduled for today. Aborting processing.")
+        return
+
+    processed_events = await process_today_events(today_events)
+    processed_count = sum(
+        len([e for e in events if not e.get("error")])
+        for events in processed_events.values()
+    )
+
+    print(f"[STEP 3] Processed {processed_count}/{today_total} events")
+
+
+def cmd_generate_images(cfg: CityConfig) -> None:
+    """Generate images from processed event data."""
+    from .pipeline import generate_images_from_processed, load_processed_events
+
+    print(f"\n[STEP 4] Generating images for {cfg.display_name}...\n")
+    try:
+        processed_events = load_processed_events()
+    except FileNotFoundError as exc:
+        print("[STEP 4] Cannot load processed events. Run the process step first.")
+        print(exc)
+        return
+
+    print(f"[STEP 4] Using processed data for {cfg.display_name}")
+
+    # omit the title initially; it will be generated later after approval
+    generated_files = generate_images_from_processed(
+        processed_events, generate_title=False
+    )
+    print(f"[STEP 4] Generated {len(generated_files)} image files")
+
+
+async def cmd_review(cfg: CityConfig) -> None:
+    """Run the legacy single-shot Discord review poll."""
+    from .pipeline import _get_generated_images_dir, _get_temp_dir
+    from .review_images import run_review
+
+    approved = await run_review(_get_generated_images_dir(), _get_temp_dir())
+    if approved:
+        print(f"\nApproved {len(approved)} image(s):")
+        for p in approved:
+            print(f"  - {p}")
+    else:
+        print("\nNo images were approved.")
+
+
+async def cmd_morning(cfg: CityConfig) -> None:
+    """Morning script: fetch, parse, generate images, send Discord poll."""
+    from .pipeline import morning_flow
+
+    _banner(f"Party Scraper — Morning ({cfg.display_name})")
+    await morning_flow()
+    _banner("Morning flow complete — poll is open!")
+
+
+async def cmd_post(cfg: CityConfig) -> None:
+    """Post script: collect poll results, generate title, finalize, upload."""
+    from .pipeline import post_flow
+
+    _banner(f"Party Scraper — Post ({cfg.display_name})")
+    await post_flow()
+    _banner("Post flow complete!")
+
+
+async def cmd_full(cfg: CityConfig) -> None:
+    """Run the full pipeline end-to-end (morning + post flows sequentially)."""
+    from .pipeline import ensure_main_flow
+
+    _banner(f"Party Scraper — {cfg.display_name}")
+    await ensure_main_flow()
+    _banner("Party Scraper - Complete!")
+
+
+_COMMANDS = {
+    "setup": cmd_setup,
+    "fetch": cmd_fetch,
+    "process": cmd_process,
+    "generate-images": cmd_generate_images,
+    "review": cmd_review,
+    "morning": cmd_morning,
+    "post": cmd_post,
+    "full": cmd_full,
+}
+
+
+# Commands that hit venue websites and can use the same-day HTML cache.
+_FETCHING_COMMANDS = {"fetch", "morning", "full"}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Party Scraper")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name, handler in _COMMANDS.items():
+        sub = subparsers.add_parser(name, help=handler.__doc__)
+        sub.add_argument(
+            "--config", required=True, help="Path to city YAML config file")
+        if name in _FETCHING_COMMANDS:
+            sub.add_argument(
+                "--force-refetch", action="store_true",
+                help="Ignore the same-day HTML cache and re-fetch every venue")
+        sub.set_defaults(handler=handler)
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+    if getattr(args, "force_refetch", False):
+        os.environ["FORCE_REFETCH"] = "1"
+    cfg = init_config(args.config)
+
+    if asyncio.iscoroutinefunction(args.handler):
+        asyncio.run(args.handler(cfg))
+    else:
+        args.handler(cfg)
+
+
+if __name__ == "__main__":
+    main()
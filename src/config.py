@@ -10,62 +10,72 @@ by environment-variable name from the YAML config.
 from __future__ import annotations
 
 import os
+import pickle
 from dataclasses import dataclass, field
+from importlib import import_module
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
 import yaml
 from dotenv import load_dotenv
 
+# Prefer the libyaml-backed C loader when PyYAML was built against it;
+# it parses the same safe subset several times faster.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 # ---------------------------------------------------------------------------
 # Parser registry – maps a string name from YAML to the actual parser function
 # ---------------------------------------------------------------------------
 
-_PARSER_REGISTRY: Dict[str, Callable] = {}
+# Built-in parsers, resolved one module at a time on first use. Each parser
+# module pulls in lxml, so importing only what the active city
+# actually references keeps cold starts cheap.
+_PARSER_MODULES: Dict[str, str] = {
+    "artbar": ".parsers.artbar",
+    "bobyhall": ".parsers.bobyhall",
+    "fleda": ".parsers.fleda",
+    "kabinet": ".parsers.kabinet",
+    "metro": ".parsers.metro",
+    "patro": ".parsers.patro",
+    "perpetuum": ".parsers.perpetuum",
+    "ra": ".parsers.ra",
+    "sono": ".parsers.sono",
+}
 
+_PARSER_REGISTRY: Dict[str, Callable] = {}
 
-def _ensure_parsers_registered() -> None:
-    """Lazily populate the parser registry on first use."""
-    if _PARSER_REGISTRY:
-        return
-
-    from .parsers.artbar import artbar_parser
-    from .parsers.bobyhall import bobyhall_parser
-    from .parsers.fleda import fleda_parser
-    from .parsers.kabinet import kabinet_parser
-    from .parsers.metro import metro_parser
-    from .parsers.patro import patro_parser
-    from .parsers.perpetuum import perpetuum_parser
-    from .parsers.ra import ra_parser
-    from .parsers.sono import sono_parser
-
-    _PARSER_REGISTRY.update({
-        "artbar": artbar_parser,
-        "bobyhall": bobyhall_parser,
-        "fleda": fleda_parser,
-        "kabinet": kabinet_parser,
-        "metro": metro_parser,
-        "patro": patro_parser,
-        "perpetuum": perpetuum_parser,
-        "ra": ra_parser,
-        "sono": sono_parser,
-    })
+# Precomputed for the KeyError message so the failure path doesn't re-sort;
+# register_parser keeps it in sync when plugins add names.
+_AVAILABLE_PARSERS = ", ".join(sorted(_PARSER_MODULES))
 
 
 def get_parser(name: str) -> Callable:
     """Return the parser function for *name*.  Raises ``KeyError`` if unknown."""
-    _ensure_parsers_registered()
-    if name not in _PARSER_REGISTRY:
-        available = ", ".join(sorted(_PARSER_REGISTRY))
+    func = _PARSER_REGISTRY.get(name)
+    if func is not None:
+        return func
+
+    module_path = _PARSER_MODULES.get(name)
+    if module_path is None:
         raise KeyError(
-            f"Unknown parser '{name}'. Available parsers: {available}"
+            f"Unknown parser '{name}'. Available parsers: {_AVAILABLE_PARSERS}"
         )
-    return _PARSER_REGISTRY[name]
+
+    module = import_module(module_path, package=__package__)
+    func = getattr(module, f"{name}_parser")
+    _PARSER_REGISTRY[name] = func
+    return func
 
 
 def register_parser(name: str, func: Callable) -> None:
     """Register an additional parser at runtime (e.g. from a plugin)."""
+    global _AVAILABLE_PARSERS
     _PARSER_REGISTRY[name] = func
+    _AVAILABLE_PARSERS = ", ".join(
+        sorted(set(_PARSER_REGISTRY) | set(_PARSER_MODULES)))
 
 
 # ---------------------------------------------------------------------------
@@ -78,6 +88,10 @@ class VenueConfig:
     url: str
     base_url: str
     parser: str  # name into _PARSER_REGISTRY
+    # Whether the listing page needs a headless browser to render. Venues
+    # serving static HTML can set this to false in the YAML to be fetched
+    # with a plain HTTP client instead (much cheaper).
+    requires_js: bool = True
 
     def get_parser_func(self) -> Callable:
         return get_parser(self.parser)
@@ -89,6 +103,7 @@ class VenueConfig:
             "url": self.url,
             "baseUrl": self.base_url,
             "parser": self.get_parser_func(),
+            "requires_js": self.requires_js,
         }
 
 
@@ -195,18 +210,48 @@ def _build_venues(raw: list) -> List[VenueConfig]:
             url=v["url"],
             base_url=v.get("base_url", v.get("baseUrl", "")),
             parser=v["parser"],
+            requires_js=bool(v.get("requires_js", True)),
         ))
     return venues
 
 
+def _load_env_file(env_path: Path) -> None:
+    """Load the city ``.env`` file, falling back to cwd/.env if it's missing."""
+    if env_path.exists():
+        load_dotenv(dotenv_path=env_path, override=True)
+        print(f"[Config] Loaded env file: {env_path}")
+    else:
+        # ultimate fallback – cwd/.env
+        load_dotenv()
+
+
 def load_config(path: str | Path) -> CityConfig:
-    """Parse a YAML city-config file and return a ``CityConfig``."""
+    """Parse a YAML city-config file and return a ``CityConfig``.
+
+    The parsed result is cached next to the YAML file in a pickle keyed on
+    the YAML's mtime and size, so warm starts skip the parse entirely.
+    Editing the YAML invalidates the cache automatically.
+    """
     path = Path(path)
     if not path.exists():
         raise FileNotFoundError(f"Config file not found: {path}")
 
+    stat = path.stat()
+    cache_key = (stat.st_mtime_ns, stat.st_size)
+    cache_path = path.with_suffix(path.suffix + ".cache.pkl")
+
+    try:
+        with cache_path.open("rb") as fh:
+            stored_key, env_path, config = pickle.load(fh)
+        if stored_key == cache_key:
+            _load_env_file(env_path)
+            return config
+    except (OSError, pickle.UnpicklingError, EOFError,
+            AttributeError, ValueError):
+        pass  # missing/stale/incompatible cache → parse the YAML
+
     with path.open("r", encoding="utf-8") as fh:
-        raw: Dict[str, Any] = yaml.safe_load(fh)
+        raw: Dict[str, Any] = yaml.load(fh, Loader=_YamlLoader)
 
     # ── load the city-specific .env file ──────────────────────────────
     # The YAML may specify  env_file: .env.brno  (relative to project root).
@@ -223,12 +268,7 @@ def load_config(path: str | Path) -> CityConfig:
         else:
             env_path = project_root / ".env"
 
-    if env_path.exists():
-        load_dotenv(dotenv_path=env_path, override=True)
-        print(f"[Config] Loaded env file: {env_path}")
-    else:
-        # ultimate fallback – cwd/.env
-        load_dotenv()
+    _load_env_file(env_path)
 
     city_raw = raw.get("city", {})
     ig_raw = raw.get("instagram", {})
@@ -284,7 +324,7 @@ def load_config(path: str | Path) -> CityConfig:
         review_timeout=dc_raw.get("review_timeout", 600),
     )
 
-    return CityConfig(
+    config = CityConfig(
         name=city_raw.get("name", "default"),
         display_name=city_raw.get(
             "display_name", city_raw.get("name", "Default")),
@@ -296,6 +336,14 @@ def load_config(path: str | Path) -> CityConfig:
         discord=discord_cfg,
     )
 
+    try:
+        with cache_path.open("wb") as fh:
+            pickle.dump((cache_key, env_path, config), fh)
+    except OSError:
+        pass  # read-only configs dir — just parse again next time
+
+    return config
+
 
 # ---------------------------------------------------------------------------
 # Global singleton – set once at startup via ``init_config()``
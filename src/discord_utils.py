@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-import asyncio
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 import discord
@@ -12,13 +12,22 @@ from dotenv import load_dotenv
 
 # ── config ────────────────────────────────────────────────────────────────────
 
+# Built once per process; env vars don't change mid-run, so re-parsing .env
+# and re-reading them on every Discord send is wasted work.
+_CONFIG_CACHE: dict | None = None
+
 
 def load_discord_config() -> dict:
     """Build the Discord config dict.
 
     Prefers values from the city config (if loaded), falling back to raw
-    environment variables for backwards compatibility.
+    environment variables for backwards compatibility. The result is cached
+    for the lifetime of the process.
     """
+    global _CONFIG_CACHE
+    if _CONFIG_CACHE is not None:
+        return _CONFIG_CACHE
+
     load_dotenv()
 
     # Try city config first
@@ -46,81 +55,101 @@ def load_discord_config() -> dict:
             "REVIEW_CHANNEL_ID or TARGET_CHANNEL_ID is required in .env."
         )
 
-    return {
+    _CONFIG_CACHE = {
         "token": token,
         "channel_id": channel_id,
         "reviewer_id": reviewer_id,
         "timeout": max(timeout, 10),
     }
+    return _CONFIG_CACHE
 
 
-# ── one-off messaging ────────────────────────────────────────────────────────
+# ── shared client ────────────────────────────────────────────────────────────
 
 
-async def send_discord_message(text: str) -> None:
-    """Connect to Discord, send a single message to the review channel, disconnect.
+@asynccontextmanager
+async def with_discord_client():
+    """Log in once and yield the review channel; closes the client on exit.
 
-    Used by the pipeline to post status updates (e.g. Instagram upload result).
+    Uses a REST-only login (no gateway handshake), which is all that's
+    needed for sending messages and files. Yields ``None`` when login
+    fails so callers can degrade gracefully.
     """
     config = load_discord_config()
-    done = asyncio.Event()
-
     intents = discord.Intents(guilds=True, messages=True)
     client = discord.Client(intents=intents)
-
-    @client.event
-    async def on_ready() -> None:
+    try:
         try:
-            channel = client.get_channel(config["channel_id"])
-            if channel is None:
-                channel = await client.fetch_channel(config["channel_id"])
-            if isinstance(channel, discord.TextChannel):
-                await channel.send(text)
-        finally:
-            await client.close()
-            done.set()
+            await client.login(config["token"])
+            channel = await client.fetch_channel(config["channel_id"])
+        except discord.LoginFailure:
+            print("[Discord] Login failed — messages will be skipped.")
+            channel = None
+        except discord.HTTPException as exc:
+            # Wrong/deleted channel ID, missing permission, or a transient
+            # API error — status messages are best-effort, never fatal.
+            print(f"[Discord] Could not fetch channel "
+                  f"{config['channel_id']}: {exc} — messages will be skipped.")
+            channel = None
+        if channel is not None and not isinstance(channel, discord.TextChannel):
+            print(f"[Discord] Channel {config['channel_id']} is not a text "
+                  "channel — messages will be skipped.")
+            channel = None
+        yield channel
+    finally:
+        await client.close()
 
-    try:
-        await client.start(config["token"])
-    except discord.LoginFailure:
-        print("[Discord] Could not send message — login failed.")
+
+# ── one-off messaging ────────────────────────────────────────────────────────
+
+
+async def send_discord_message(text: str, channel=None) -> None:
+    """Send a single message to the review channel.
+
+    When *channel* (from ``with_discord_client``) is provided, the message
+    goes straight out over the existing connection. Otherwise a one-off
+    client is connected and torn down around the send.
+
+    Used by the pipeline to post status updates (e.g. Instagram upload result).
+    """
+    if channel is not None:
+        try:
+            await channel.send(text)
+        except discord.HTTPException as exc:
+            print(f"[Discord] Failed to send message: {exc}")
         return
 
-    await done.wait()
+    async with with_discord_client() as ch:
+        if ch is not None:
+            await ch.send(text)
+        else:
+            print("[Discord] Could not send message — login failed.")
 
 
-async def send_discord_file(file_path: str | Path, message: str = "") -> None:
-    """Connect to Discord, send a file (with optional text) to the review channel."""
+async def send_discord_file(
+    file_path: str | Path, message: str = "", channel=None,
+) -> None:
+    """Send a file (with optional text) to the review channel.
+
+    Accepts an optional *channel* from ``with_discord_client`` to reuse an
+    existing connection, mirroring ``send_discord_message``.
+    """
     path = Path(file_path)
     if not path.exists():
         print(f"[Discord] File not found, skipping: {path}")
         return
 
-    config = load_discord_config()
-    done = asyncio.Event()
-
-    intents = discord.Intents(guilds=True, messages=True)
-    client = discord.Client(intents=intents)
-
-    @client.event
-    async def on_ready() -> None:
+    if channel is not None:
         try:
-            channel = client.get_channel(config["channel_id"])
-            if channel is None:
-                channel = await client.fetch_channel(config["channel_id"])
-            if isinstance(channel, discord.TextChannel):
-                await channel.send(
-                    message,
-                    file=discord.File(str(path), filename=path.name),
-                )
-        finally:
-            await client.close()
-            done.set()
-
-    try:
-        await client.start(config["token"])
-    except discord.LoginFailure:
-        print("[Discord] Could not send file — login failed.")
+            await channel.send(
+                message, file=discord.File(str(path), filename=path.name))
+        except discord.HTTPException as exc:
+            print(f"[Discord] Failed to send file: {exc}")
         return
 
-    await done.wait()
+    async with with_discord_client() as ch:
+        if ch is not None:
+            await ch.send(
+                message, file=discord.File(str(path), filename=path.name))
+        else:
+            print("[Discord] Could not send file — login failed.")
@@ -3,12 +3,12 @@ Event Parser - Orchestrates fetching HTML and parsing events from all venues.
 Applies the appropriate parser for each venue and filters/sorts results.
 Replicates the useScraper hook logic from the frontend.
 """
-import json
 import os
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Callable
 
 from .config import get_config
+from .jsonio import dump_json
 
 
 def get_venues() -> List[dict]:
@@ -16,10 +16,33 @@ def get_venues() -> List[dict]:
     return get_config().venues_as_legacy_list()
 
 
+# Parser lookup is rebuilt only when the active config changes, not on
+# every parse_all_venues call.
+_parser_map: Optional[Dict[str, Callable]] = None
+_parser_map_cfg = None
+
+
+def _get_parser_map() -> Dict[str, Callable]:
+    """Return a title → parser-function map for the active city config."""
+    global _parser_map, _parser_map_cfg
+    cfg = get_config()
+    if _parser_map is None or _parser_map_cfg is not cfg:
+        _parser_map = {v.title: v.get_parser_func() for v in cfg.venues}
+        _parser_map_cfg = cfg
+    return _parser_map
+
+
+# Sorts undated events last; ISO date strings compare lexicographically.
+_MAX_DATE = "9999-99-99"
+
+
 def filter_and_sort_events(
     events: List[dict],
     filter_past: bool = True,
     max_results: int = 4,
+    *,
+    today_str: Optional[str] = None,
+    presorted: bool = False,
 ) -> List[dict]:
     """
     Filter and sort parsed events.
@@ -29,44 +52,53 @@ def filter_and_sort_events(
         events: List of parsed event dicts with 'url' and 'date' keys.
         filter_past: Whether to filter out past events.
         max_results: Maximum number of results to return (0 = no limit).
+        today_str: Today's ISO date string; computed if not supplied.
+            Callers iterating many venues should compute it once and pass it in.
+        presorted: Set when *events* is already in chronological page order;
+            skips the sort and stops scanning once max_results are collected.
 
     Returns:
         Filtered and sorted list of events.
     """
-    processed = list(events)
-    today = datetime.now().strftime("%Y-%m-%d")
+    today = today_str or datetime.now().strftime("%Y-%m-%d")
 
-    # Filter past events
-    if filter_past:
-        processed = [
-            item for item in processed
-            if not item.get("date") or item["date"] >= today
-        ]
-
-    # Deduplicate by URL
+    # Filter past events and deduplicate by URL (keep-first) in one pass.
+    # Items without a URL are always kept.
     seen_urls = set()
-    deduped = []
-    for item in processed:
+    processed = []
+    for item in events:
+        if filter_past:
+            date = item.get("date")
+            if date and date < today:
+                continue
         url = item.get("url", "")
-        if not url:
-            deduped.append(item)
-            continue
-        if url not in seen_urls:
+        if url:
+            if url in seen_urls:
+                continue
             seen_urls.add(url)
-            deduped.append(item)
-    processed = deduped
+        processed.append(item)
+        if presorted and max_results > 0 and len(processed) >= max_results:
+            break
 
-    # Sort by date
-    processed.sort(key=lambda a: a.get("date") or "9999-99-99")
+    if not presorted:
+        # Sort by date
+        processed.sort(key=lambda a: a.get("date") or _MAX_DATE)
 
-    # Limit results
-    if max_results > 0:
-        processed = processed[:max_results]
+        # Limit results
+        if max_results > 0:
+            processed = processed[:max_results]
 
     return processed
 
 
-def parse_venue_html(html: str, parser: Callable, filter_past: bool = True, max_results: int = 4) -> List[dict]:
+def parse_venue_html(
+    html: str,
+    parser: Callable,
+    filter_past: bool = True,
+    max_results: int = 4,
+    *,
+    today_str: Optional[str] = None,
+) -> List[dict]:
     """
     Parse HTML with the given parser function and apply filtering.
 
@@ -75,31 +107,53 @@ def parse_venue_html(html: str, parser: Callable, filter_past: bool = True, max_
         parser: Parser function that takes HTML and returns list of event dicts.
         filter_past: Whether to filter past events.
         max_results: Maximum results per venue (0 = no limit).
+        today_str: Today's ISO date string; computed if not supplied.
 
     Returns:
         Filtered and sorted list of event dicts.
     """
     raw_events = parser(html)
-    return filter_and_sort_events(raw_events, filter_past=filter_past, max_results=max_results)
+    # Parsers that emit events in the page's chronological order can mark
+    # themselves with a `presorted` attribute to skip the per-venue sort.
+    presorted = bool(getattr(parser, "presorted", False))
+    return filter_and_sort_events(
+        raw_events, filter_past=filter_past, max_results=max_results,
+        today_str=today_str, presorted=presorted)
 
 
-def parse_all_venues(html_results: Dict[str, Optional[str]], filter_past: bool = True, max_results: int = 4) -> Dict[str, List[dict]]:
+def parse_all_venues(
+    html_results: Dict[str, Optional[str]],
+    filter_past: bool = True,
+    max_results: int = 4,
+    *,
+    venues: Optional[List[dict]] = None,
+) -> Dict[str, List[dict]]:
     """
     Parse HTML for all venues and return structured results.
 
     Args:
         html_results: Dict mapping venue title to HTML string (or None).
+            Entries are popped as they are parsed to free the HTML early.
         filter_past: Whether to filter past events.
         max_results: Maximum results per venue (0 = no limit).
+        venues: Optional venue subset (legacy dict format); defaults to the
+            active city config's full venue list.
 
     Returns:
         Dict mapping venue title to list of {url, date} dicts.
     """
-    # Build parser lookup
-    parser_map = {v["title"]: v["parser"] for v in get_venues()}
+    if venues is None:
+        parser_map = _get_parser_map()
+    else:
+        parser_map = {v["title"]: v["parser"] for v in venues}
+    today_str = datetime.now().strftime("%Y-%m-%d")
 
     all_events = {}
-    for title, html in html_results.items():
+    # Consume html_results destructively so each page's HTML (hundreds of
+    # KB for the bigger listings) is released as soon as it is parsed,
+    # instead of keeping every page alive until the loop finishes.
+    for title in list(html_results):
+        html = html_results.pop(title)
         if not html:
             print(f"[Parser] {title}: No HTML to parse, skipping.")
             all_events[title] = []
@@ -111,7 +165,9 @@ def parse_all_venues(html_results: Dict[str, Optional[str]], filter_past: bool =
             all_events[title] = []
             continue
 
-        events = parse_venue_html(html, parser, filter_past=filter_past, max_results=max_results)
+        events = parse_venue_html(
+            html, parser, filter_past=filter_past, max_results=max_results,
+            today_str=today_str)
         all_events[title] = events
         print(f"[Parser] {title}: Found {len(events)} events")
 
@@ -157,6 +213,5 @@ def save_fetched_events(events: Dict[str, List[dict]], output_path: str):
         output_path: Path to save the JSON file.
     """
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(events, f, ensure_ascii=False, indent=2)
+    dump_json(events, output_path)
     print(f"[Parser] Saved fetched events to: {output_path}")
@@ -5,29 +5,42 @@ Reused from src/extractor.py
 import os
 import json
 from typing import Optional
-from google import genai
-from google.genai import types
 from dotenv import load_dotenv
 from .models import EventDetail
 
-# Load .env from project root or parent
-load_dotenv()
-# Also try parent directory
-load_dotenv(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".env"))
-# Also try grandparent directory (party-scraper root)
-load_dotenv(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), ".env"))
+# google-genai pulls in gRPC/protobuf/auth and is slow to import, so it is
+# loaded inside _get_client() — importing this module stays cheap for
+# callers that never reach Gemini.
 
-API_KEY = os.getenv("GEMINI_API_KEY")
-if not API_KEY:
-    print("[Extractor] WARNING: GEMINI_API_KEY is not set in .env file")
+_dotenv_loaded = False
 
 client = None
 model_name = "gemini-2.0-flash"
 
 
+def _load_dotenv_once() -> None:
+    """Load the first .env found walking up from this file (once per process)."""
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
+    _dotenv_loaded = True
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    for directory in (os.getcwd(), os.path.dirname(here),
+                      os.path.dirname(os.path.dirname(here))):
+        candidate = os.path.join(directory, ".env")
+        if os.path.exists(candidate):
+            load_dotenv(candidate)
+            return
+    load_dotenv()
+
+
 def _get_client():
     global client
     if client is None:
+        from google import genai
+
+        _load_dotenv_once()
         api_key = os.getenv("GEMINI_API_KEY")
         if not api_key:
             raise ValueError("GEMINI_API_KEY is not set in .env file")
@@ -35,22 +48,15 @@ def _get_client():
     return client
 
 
-def extract_event_detail(content: str) -> Optional[EventDetail]:
-    """
-    Use Gemini to extract structured event details from markdown/text content.
-    
-    Args:
-        content: The markdown or text content of an event page.
-        
-    Returns:
-        EventDetail model or None on failure.
-    """
-    prompt = f"""
+# Static instruction prefix, sent as its own content part. Keeping it
+# byte-identical across calls lets Gemini's implicit prompt caching reuse
+# the prefix tokens instead of re-billing them per event.
+_PROMPT_PREFIX = """
     You are an expert event data extractor.
     Extract the following information from the provided text content of a party event page.
     Return the result as a JSON object matching this schema:
 
-    {{
+    {
         "title": "Name of the event",
         "date": "Date of the event in RRRR-MM-DD format. 'sobota 14. února' will be '2026-02-14'",
         "time": "HH:MM",
@@ -58,37 +64,91 @@ def extract_event_detail(content: str) -> Optional[EventDetail]:
         "price": "Price info (optional)",
         "description": "Short description",
         "image_url": "Main image URL (optional)"
-    }}
+    }
 
     CRITICAL: Output date format '2026-02-14' if text is 'sobota 14. února'
     CRITICAL: Use original langugage.
 
     If any field is missing, try to infer it from context or use null/empty string appropriately for required fields.
 
-    Content:
-    {content[:10000]}
+    Content follows in the next part.
+    """
+
+# Content budget, roughly 3000 tokens. Czech text runs ~3.3 chars per token,
+# so this is a character-level approximation; an exact count would need a
+# count_tokens round-trip per call, which costs more than it saves.
+_MAX_CONTENT_CHARS = 10000
+
+
+def _build_contents(content: str) -> list:
+    """Build the two-part request: static prefix + truncated page content."""
+    return [_PROMPT_PREFIX, content[:_MAX_CONTENT_CHARS]]
+
+
+def _generation_config():
+    from google.genai import types
+
+    return types.GenerateContentConfig(
+        temperature=0.2, top_p=0.95, top_k=64,
+        max_output_tokens=8192, response_mime_type="application/json",
+    )
+
+
+def _parse_response_text(text: Optional[str]) -> Optional[EventDetail]:
+    """Decode a Gemini JSON response into an EventDetail (None on failure)."""
+    if not text:
+        print("Empty response from Gemini API")
+        return None
+    result = json.loads(text)
+    if isinstance(result, list) and len(result) > 0:
+        result = result[0]
+    if not isinstance(result, dict):
+        print(f"Extraction result is not a mapping: {result}")
+        return None
+    return EventDetail(**result)
+
+
+def extract_event_detail(content: str) -> Optional[EventDetail]:
     """
+    Use Gemini to extract structured event details from markdown/text content.
+
+    Args:
+        content: The markdown or text content of an event page.
 
+    Returns:
+        EventDetail model or None on failure.
+    """
     try:
         c = _get_client()
         response = c.models.generate_content(
             model=model_name,
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                temperature=0.2, top_p=0.95, top_k=64,
-                max_output_tokens=8192, response_mime_type="application/json",
-            )
+            contents=_build_contents(content),
+            config=_generation_config(),
+        )
+        return _parse_response_text(response.text)
+    except json.JSONDecodeError:
+        print(f"Failed to decode JSON from Gemini response: {response.text if 'response' in locals() else 'No response'}")
+        return None
+    except Exception as e:
+        print(f"Error during extraction or API call: {e}")
+        return None
+
+
+async def extract_event_detail_async(content: str) -> Optional[EventDetail]:
+    """
+    Async variant of `extract_event_detail` using the SDK's aio client.
+
+    Lets the scraper pipeline keep many extractions in flight on the event
+    loop without burning a worker thread per call.
+    """
+    try:
+        c = _get_client()
+        response = await c.aio.models.generate_content(
+            model=model_name,
+            contents=_build_contents(content),
+            config=_generation_config(),
         )
-        if not response.text:
-            print("Empty response from Gemini API")
-            return None
-        result = json.loads(response.text)
-        if isinstance(result, list) and len(result) > 0:
-            result = result[0]
-        if not isinstance(result, dict):
-            print(f"Extraction result is not a mapping: {result}")
-            return None
-        return EventDetail(**result)
+        return _parse_response_text(response.text)
     except json.JSONDecodeError:
         print(f"Failed to decode JSON from Gemini response: {response.text if 'response' in locals() else 'No response'}")
         return None
@@ -3,36 +3,104 @@ HTML Fetcher - Uses Playwright with stealth to fetch HTML from venue websites.
 Replicates the /fetch-html endpoint logic from the backend.
 """
 import asyncio
-import random
+import gzip
+import hashlib
+import os
 import platform
+from datetime import datetime
+from pathlib import Path
 from typing import Optional
+
+import httpx
 from playwright.async_api import async_playwright
 from playwright_stealth import Stealth
 
+_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
+)
 
-async def fetch_html(url: str, base_url: str = "") -> Optional[str]:
+
+# ── same-day HTML cache ──────────────────────────────────────────────────────
+# Re-running the pipeline the same day (debugging a parser, retrying after a
+# Discord hiccup) shouldn't re-hit every venue website. Fetched HTML is
+# gzipped under temp/html-cache keyed by URL hash and date; a new day (or
+# FORCE_REFETCH=1 in the environment) bypasses it.
+
+_HTML_CACHE_DIR = Path(__file__).resolve().parent.parent / "temp" / "html-cache"
+
+
+def _cache_path(url: str) -> Path:
+    digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    day = datetime.now().strftime("%Y-%m-%d")
+    return _HTML_CACHE_DIR / f"{digest}.{day}.html.gz"
+
+
+def _cache_get(url: str) -> Optional[str]:
+    if os.getenv("FORCE_REFETCH"):
+        return None
+    path = _cache_path(url)
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as fh:
+            return fh.read()
+    except OSError:
+        return None
+
+
+def _cache_put(url: str, html: str) -> None:
+    path = _cache_path(url)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Drop stale entries for the same URL from previous days.
+        digest = path.name.split(".", 1)[0]
+        for old in path.parent.glob(f"{digest}.*.html.gz"):
+            if old != path:
+                old.unlink(missing_ok=True)
+        with gzip.open(path, "wt", encoding="utf-8") as fh:
+            fh.write(html)
+    except OSError as e:
+        print(f"[Fetcher] Could not write HTML cache: {e}")
+
+
+# Resource types the scraper never needs — we only read the DOM, so
+# skipping these cuts most of the transferred bytes and layout work.
+_BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+
+
+async def _block_heavy_resources(route) -> None:
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _fetch_with_browser(browser, url: str, base_url: str = "") -> Optional[str]:
     """
-    Fetch the HTML content of a URL using Playwright with stealth mode.
+    Fetch a URL through an already-launched (stealth-wrapped) browser.
+    Creates a fresh context per call so venues don't share cookies/state.
 
     Args:
+        browser: A running Playwright browser instance.
         url: The target URL to fetch.
         base_url: The base URL of the website (visited first to appear natural).
 
     Returns:
         The HTML content as a string, or None on failure.
     """
+    cached = _cache_get(url)
+    if cached is not None:
+        print(f"[Fetcher] Using same-day cached HTML for: {url}")
+        return cached
+
     print(f"[Fetcher] Requesting HTML with Stealth for: {url}")
     try:
-        async with Stealth().use_async(async_playwright()) as p:
-            browser = await p.chromium.launch(
-                headless=True,
-                args=["--no-sandbox"]
-            )
-            context = await browser.new_context(
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
-                viewport={"width": 1920, "height": 1080},
-                locale="cs-CZ"
-            )
+        context = await browser.new_context(
+            user_agent=_USER_AGENT,
+            viewport={"width": 1920, "height": 1080},
+            locale="cs-CZ"
+        )
+        try:
+            await context.route("**/*", _block_heavy_resources)
             page = await context.new_page()
 
             # Visit base URL first to appear natural
@@ -40,7 +108,6 @@ async def fetch_html(url: str, base_url: str = "") -> Optional[str]:
                 try:
                     print(f"[Fetcher] Visiting home page first: {base_url}")
                     await page.goto(base_url, wait_until="domcontentloaded", timeout=20000)
-                    await asyncio.sleep(random.uniform(1, 2))
                 except Exception:
                     pass
 
@@ -51,18 +118,88 @@ async def fetch_html(url: str, base_url: str = "") -> Optional[str]:
             if response and response.status == 403:
                 print("[Fetcher] ALERT: 403 Forbidden detected!")
                 await page.mouse.wheel(0, 500)
-                await browser.close()
                 return None
 
-            # Scroll and wait for dynamic content
+            # Scroll, then wait for the network to settle instead of a
+            # fixed 2s sleep; pages that are already quiet return at once.
             await page.mouse.wheel(0, 511)
-            await asyncio.sleep(2)
+            try:
+                await page.wait_for_load_state("networkidle", timeout=3000)
+            except Exception:
+                pass
 
             html = await page.content()
-            await browser.close()
             print(f"[Fetcher] Success: {len(html)} chars retrieved.")
+            _cache_put(url, html)
             return html
+        finally:
+            await context.close()
+
+    except Exception as e:
+        print(f"[Fetcher] Critical Error: {str(e)}")
+        return None
+
+
+async def fetch_html(url: str, base_url: str = "") -> Optional[str]:
+    """
+    Fetch the HTML content of a single URL using Playwright with stealth mode.
+
+    One-shot helper that launches (and tears down) its own browser; batch
+    callers should go through `fetch_all_venues`, which shares one browser.
+
+    Args:
+        url: The target URL to fetch.
+        base_url: The base URL of the website (visited first to appear natural).
+
+    Returns:
+        The HTML content as a string, or None on failure.
+    """
+    try:
+        async with Stealth().use_async(async_playwright()) as p:
+            browser = await p.chromium.launch(
+                headless=True,
+                args=["--no-sandbox"]
+            )
+            try:
+                return await _fetch_with_browser(browser, url, base_url)
+            finally:
+                await browser.close()
+    except Exception as e:
+        print(f"[Fetcher] Critical Error: {str(e)}")
+        return None
+
+
+# Cap on simultaneously open browser sessions; fetches are network-bound so
+# a few in parallel overlap most of the waiting without eating all the RAM.
+FETCH_CONCURRENCY = int(os.getenv("FETCH_CONCURRENCY", "4"))
+
+
+async def _fetch_with_httpx(client: "httpx.AsyncClient", url: str) -> Optional[str]:
+    """
+    Fetch a static listing page with a plain HTTP GET — no browser involved.
 
+    Args:
+        client: A shared httpx.AsyncClient (connection pool reuse).
+        url: The target URL to fetch.
+
+    Returns:
+        The HTML content as a string, or None on failure.
+    """
+    cached = _cache_get(url)
+    if cached is not None:
+        print(f"[Fetcher] Using same-day cached HTML for: {url}")
+        return cached
+
+    print(f"[Fetcher] Requesting HTML via httpx for: {url}")
+    try:
+        response = await client.get(url)
+        if response.status_code >= 400:
+            print(f"[Fetcher] HTTP {response.status_code} for {url}")
+            return None
+        html = response.text
+        print(f"[Fetcher] Success: {len(html)} chars retrieved.")
+        _cache_put(url, html)
+        return html
     except Exception as e:
         print(f"[Fetcher] Critical Error: {str(e)}")
         return None
@@ -70,7 +207,10 @@ async def fetch_html(url: str, base_url: str = "") -> Optional[str]:
 
 async def fetch_all_venues(venues: list) -> dict:
     """
-    Fetch HTML for all venues sequentially.
+    Fetch HTML for all venues concurrently (bounded by FETCH_CONCURRENCY).
+
+    Venues with ``requires_js: false`` in the config are fetched with a
+    shared httpx client; only the rest pay for the headless browser.
 
     Args:
         venues: List of venue dicts with 'title', 'url', 'baseUrl', 'parser' keys.
@@ -78,18 +218,67 @@ async def fetch_all_venues(venues: list) -> dict:
     Returns:
         Dict mapping venue title to fetched HTML string.
     """
+    semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+    htmls: dict = {}
+
+    static_venues = [v for v in venues if not v.get("requires_js", True)]
+    js_venues = [v for v in venues if v.get("requires_js", True)]
+
+    if static_venues:
+        async with httpx.AsyncClient(
+            headers={"User-Agent": _USER_AGENT},
+            timeout=10,
+            follow_redirects=True,
+        ) as client:
+            async def _bounded_get(venue: dict) -> Optional[str]:
+                async with semaphore:
+                    print(f"\n{'='*40}")
+                    print(f"  Fetching (static): {venue['title']}")
+                    print(f"{'='*40}")
+                    return await _fetch_with_httpx(client, venue["url"])
+
+            static_htmls = await asyncio.gather(
+                *(_bounded_get(venue) for venue in static_venues),
+                return_exceptions=True,
+            )
+        for venue, html in zip(static_venues, static_htmls):
+            htmls[venue["title"]] = html
+
+    if js_venues:
+        # One Chromium launch for the whole batch; each venue gets its own
+        # context so the only per-venue cost is context + page creation.
+        async with Stealth().use_async(async_playwright()) as p:
+            browser = await p.chromium.launch(
+                headless=True,
+                args=["--no-sandbox"]
+            )
+
+            async def _bounded_fetch(venue: dict) -> Optional[str]:
+                async with semaphore:
+                    print(f"\n{'='*40}")
+                    print(f"  Fetching: {venue['title']}")
+                    print(f"{'='*40}")
+                    return await _fetch_with_browser(
+                        browser, venue["url"], venue.get("baseUrl", ""))
+
+            try:
+                js_htmls = await asyncio.gather(
+                    *(_bounded_fetch(venue) for venue in js_venues),
+                    return_exceptions=True,
+                )
+            finally:
+                await browser.close()
+        for venue, html in zip(js_venues, js_htmls):
+            htmls[venue["title"]] = html
+
     results = {}
     for venue in venues:
         title = venue["title"]
-        url = venue["url"]
-        base_url = venue.get("baseUrl", "")
-
-        print(f"\n{'='*40}")
-        print(f"  Fetching: {title}")
-        print(f"{'='*40}")
-
-        html = await fetch_html(url, base_url)
-        if html:
+        html = htmls.get(title)
+        if isinstance(html, BaseException):
+            print(f"[Fetcher] {title}: FAILED to fetch HTML ({html})")
+            results[title] = None
+        elif html:
             results[title] = html
             print(f"[Fetcher] {title}: Got {len(html)} chars")
         else:
@@ -2,17 +2,23 @@
 Image Generator - Creates Instagram-style event images using Playwright.
 Replicates the InstagramGenerator component's visual design.
 """
-import base64
+import asyncio
+import atexit
+import hashlib
+import os
 import random
 import re
+import threading
 import unicodedata
 from datetime import datetime
 from pathlib import Path
-from string import Template
 from typing import Dict, List, Optional, Tuple
-from urllib.request import Request, urlopen
+import httpx
 from playwright.sync_api import sync_playwright
 
+from . import playwright_runtime
+from .playwright_runtime import get_shared_browser
+
 
 def _get_fallback_location() -> str:
     """Return the city display name for use as a fallback location label."""
@@ -41,65 +47,308 @@ def _get_title_alt() -> str:
         return "Events"
 
 
-def download_image_as_data_uri(url: str) -> Optional[str]:
-    """Download an image URL and return it as a base64 data URI."""
+# Event images live on CDNs where the content behind a URL never changes,
+# so the raw bytes are cached on disk and reused across runs.
+_IMG_CACHE_DIR = Path(__file__).resolve().parent.parent / "temp" / "img-cache"
+
+
+_DOWNLOAD_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+
+async def download_image_to_file(client: "httpx.AsyncClient", url: str) -> Optional[str]:
+    """Download an image into the on-disk cache and return a file:// URI.
+
+    The bytes are written to disk and the rendered HTML references the
+    file directly — no base64 round-trip, so the HTML stays small and
+    Chromium decodes the image from disk instead of a 33%-larger inline
+    payload. Cached under temp/img-cache keyed by the URL hash, so repeat
+    runs skip the download entirely. Fetches share *client*, whose HTTP/2
+    connection pool multiplexes same-CDN downloads over one handshake.
+    """
     if not url:
         return None
+
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    cache_file = _IMG_CACHE_DIR / f"{digest}.img"
+    if cache_file.exists():
+        return cache_file.as_uri()
+
     try:
-        req = Request(
-            url,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            },
-        )
-        with urlopen(req, timeout=15) as resp:
-            content_type = resp.headers.get("Content-Type", "image/jpeg")
-            if ";" in content_type:
-                content_type = content_type.split(";")[0].strip()
-            if content_type == "application/octet-stream":
-                content_type = "image/jpeg"
-            data = resp.read()
-            b64 = base64.b64encode(data).decode("ascii")
-            return f"data:{content_type};base64,{b64}"
+        resp = await client.get(url)
+        resp.raise_for_status()
+        _IMG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(".tmp")
+        tmp_file.write_bytes(resp.content)
+        os.replace(tmp_file, cache_file)
+        return cache_file.as_uri()
     except Exception as exc:
         print(f"[ImageGen] WARNING: Could not download image {url[:80]}... : {exc}")
         return None
 
 
+async def _download_all(urls: List[str]) -> Dict[str, Optional[str]]:
+    """Fetch all *urls* concurrently over one HTTP/2 connection pool."""
+    async with httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=10),
+        headers={"User-Agent": _DOWNLOAD_USER_AGENT},
+        timeout=15.0,
+        follow_redirects=True,
+    ) as client:
+        results = await asyncio.gather(
+            *(download_image_to_file(client, url) for url in urls),
+            return_exceptions=True,
+        )
+    return {
+        url: (None if isinstance(result, BaseException) else result)
+        for url, result in zip(urls, results)
+    }
+
+
 TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
 
 
-def _load_template(name: str) -> Template:
+_PLACEHOLDER_RE = re.compile(r"\$(\w+)")
+
+
+class _CompiledTemplate:
+    """A template pre-split into segments so each render is just a join.
+
+    string.Template.substitute re-scans the whole text with a regex on
+    every call; splitting once at load time leaves only dict lookups and a
+    join per render. (str.format_map isn't an option — the templates
+    contain literal CSS braces.)
+    """
+
+    def __init__(self, text: str):
+        # Even indices are literal chunks, odd indices are field names.
+        self._segments = _PLACEHOLDER_RE.split(text)
+
+    def substitute(self, **fields: str) -> str:
+        segments = self._segments
+        out = list(segments)
+        for i in range(1, len(out), 2):
+            out[i] = str(fields[segments[i]])
+        return "".join(out)
+
+
+def _load_template(name: str) -> _CompiledTemplate:
     path = TEMPLATES_DIR / name
-    return Template(path.read_text(encoding="utf-8"))
+    return _CompiledTemplate(path.read_text(encoding="utf-8"))
 
 
 EVENT_TEMPLATE = _load_template("event.html")
 TITLE_TEMPLATE = _load_template("title.html")
 
 
+# Both templates @import the Inter webfont; rendering it once right after
+# browser launch pulls the CSS + woff2 files into Chromium's cache so the
+# first real screenshot doesn't pay the font download.
+_FONT_WARMUP_HTML = (
+    "<html><head><style>"
+    "@import url('https://fonts.googleapis.com/css2"
+    "?family=Inter:wght@400;600;800;900&display=swap');"
+    "</style></head><body>"
+    + "".join(
+        f"<span style=\"font-family:'Inter';font-weight:{w}\">warm</span>"
+        for w in (400, 600, 800, 900)
+    )
+    + "</body></html>"
+)
+
+
+def _screenshot_kwargs(screenshot_path: Path) -> dict:
+    """Shared screenshot options: fixed-square clip, JPEG for .jpg paths.
+
+    JPEG encoding is several times faster than PNG's zlib pass for
+    photographic content and the files are ~5x smaller; Instagram accepts
+    both.
+    """
+    kwargs: dict = {
+        "full_page": False,
+        "clip": {"x": 0, "y": 0, "width": 1080, "height": 1080},
+    }
+    if screenshot_path.suffix.lower() in {".jpg", ".jpeg"}:
+        kwargs.update(type="jpeg", quality=90)
+    return kwargs
+
+
+async def _warm_fonts_async(browser) -> None:
+    try:
+        page = await browser.new_page()
+        try:
+            await page.set_content(_FONT_WARMUP_HTML, wait_until="load")
+            await page.evaluate("document.fonts.ready")
+        finally:
+            await page.close()
+    except Exception:
+        pass  # warmup is best-effort; renders still work, just colder
+
+
+class _PlaywrightPool:
+    """Lazily-started sync browser with reusable pages, per thread.
+
+    Repeated render_html_with_playwright calls used to launch (and tear
+    down) a fresh Chromium each time; the pool amortizes that to one
+    startup per process. State is thread-local because the sync Playwright
+    API is bound to the thread that started it.
+    """
+
+    def __init__(self, size: Optional[int] = None):
+        self._size = size or min(os.cpu_count() or 4, 8)
+        self._local = threading.local()
+
+    def _state(self) -> dict:
+        state = getattr(self._local, "state", None)
+        if state is None:
+            playwright = sync_playwright().start()
+            browser = playwright.chromium.launch(headless=True)
+            try:
+                warm = browser.new_page()
+                warm.set_content(_FONT_WARMUP_HTML, wait_until="load")
+                warm.evaluate("document.fonts.ready")
+                warm.close()
+            except Exception:
+                pass  # warmup is best-effort
+            state = {"playwright": playwright, "browser": browser, "pages": []}
+            self._local.state = state
+            atexit.register(self._close_state, state)
+        return state
+
+    def acquire(self):
+        state = self._state()
+        if state["pages"]:
+            return state["pages"].pop()
+        return state["browser"].new_page(
+            viewport={"width": 1080, "height": 1080})
+
+    def release(self, page) -> None:
+        state = getattr(self._local, "state", None)
+        if state is None or len(state["pages"]) >= self._size:
+            page.close()
+            return
+        try:
+            # Reset to a blank document so the next render starts clean.
+            page.goto("about:blank")
+            state["pages"].append(page)
+        except Exception:
+            try:
+                page.close()
+            except Exception:
+                pass
+
+    @staticmethod
+    def _close_state(state: dict) -> None:
+        try:
+            state["browser"].close()
+            state["playwright"].stop()
+        except Exception:
+            pass
+
+
+_POOL = _PlaywrightPool()
+
+
 def render_html_with_playwright(html: str, html_path: Path, screenshot_path: Path) -> Tuple[bool, Optional[str]]:
     html_path.parent.mkdir(parents=True, exist_ok=True)
     screenshot_path.parent.mkdir(parents=True, exist_ok=True)
     html_path.write_text(html, encoding="utf-8")
 
     try:
-        with sync_playwright() as playwright:
-            with playwright.chromium.launch(headless=True) as browser:
-                page = browser.new_page(viewport={"width": 1080, "height": 1080})
-                page.goto(html_path.as_uri(), wait_until="networkidle", timeout=60000)
-                page.wait_for_timeout(500)
-                page.screenshot(path=str(screenshot_path), full_page=True)
+        page = _POOL.acquire()
+        try:
+            # Same readiness signal as render_html_async: local file, so
+            # "load" + fonts-ready replaces networkidle + fixed sleep.
+            page.goto(html_path.as_uri(), wait_until="load", timeout=10000)
+            page.evaluate("document.fonts.ready")
+            # Same fixed-square clip as render_html_async.
+            page.screenshot(
+                path=str(screenshot_path),
+                **_screenshot_kwargs(screenshot_path))
+        finally:
+            _POOL.release(page)
         return True, None
     except Exception as exc:
         return False, str(exc)
 
 
+# Screenshot rendering is dominated by browser startup + networkidle waits,
+# so a handful of concurrent pages in one browser cuts wall time roughly
+# linearly with worker count.
+RENDER_CONCURRENCY = int(os.getenv("RENDER_CONCURRENCY", str(os.cpu_count() or 4)))
+
+
+async def render_html_async(
+    browser, html: str, html_path: Path, screenshot_path: Path,
+) -> Tuple[bool, Optional[str]]:
+    """Render *html* to a screenshot using a page on an existing browser."""
+    def _write_html() -> None:
+        html_path.parent.mkdir(parents=True, exist_ok=True)
+        screenshot_path.parent.mkdir(parents=True, exist_ok=True)
+        html_path.write_text(html, encoding="utf-8")
+
+    # File I/O happens in worker threads so the loop stays free to drive
+    # the other concurrent render pages.
+    await asyncio.to_thread(_write_html)
+
+    try:
+        page = await browser.new_page(viewport={"width": 1080, "height": 1080})
+        try:
+            # The page is a local self-contained file (images inlined as
+            # data URIs), so "load" plus a fonts-ready await is a
+            # deterministic paint signal — no need for networkidle's
+            # 500ms-of-silence heuristic or a fixed sleep.
+            await page.goto(html_path.as_uri(), wait_until="load", timeout=10000)
+            await page.evaluate("document.fonts.ready")
+            # The layout is a fixed 1080x1080 square; clipping to the
+            # viewport skips full_page's document-height measurement pass.
+            # Taking bytes and writing them off-loop keeps the disk flush
+            # out of the event loop.
+            img_bytes = await page.screenshot(
+                **_screenshot_kwargs(screenshot_path))
+            await asyncio.to_thread(screenshot_path.write_bytes, img_bytes)
+        finally:
+            await page.close()
+        return True, None
+    except Exception as exc:
+        return False, str(exc)
+
+
+_fonts_warmed = False
+
+
+async def _render_all(jobs: List[tuple]) -> List[Tuple[bool, Optional[str]]]:
+    """Render (html, html_path, png_path) jobs concurrently.
+
+    Runs on the shared Playwright runtime so repeated invocations in one
+    process reuse the same Chromium instead of relaunching it.
+    """
+    global _fonts_warmed
+    semaphore = asyncio.Semaphore(RENDER_CONCURRENCY)
+
+    browser = await get_shared_browser()
+    if not _fonts_warmed:
+        await _warm_fonts_async(browser)
+        _fonts_warmed = True
+
+    async def _bounded(html: str, html_path: Path, png_path: Path):
+        async with semaphore:
+            return await render_html_async(browser, html, html_path, png_path)
+
+    return await asyncio.gather(*(_bounded(*job) for job in jobs))
+
+
+_SLUG_RE = re.compile(r"[^a-zA-Z0-9]+")
+
+
 def slugify(text: str) -> str:
     """Convert text to a URL/filename-friendly slug."""
     text = unicodedata.normalize("NFD", text)
     text = text.encode("ascii", "ignore").decode("ascii")
-    text = re.sub(r"[^a-zA-Z0-9]+", "-", text)
+    text = _SLUG_RE.sub("-", text)
     text = text.strip("-").lower()
     return text or "event"
 
@@ -163,6 +412,26 @@ def generate_event_images(
     generated_files: List[str] = []
     background_candidates: List[str] = []
 
+    # Prefetch all remote images concurrently — the serial urlopen calls
+    # used to dominate this stage with pure sequential network latency.
+    remote_urls = list({
+        event.get("image_url", "")
+        for events in processed_events.values()
+        for event in events
+        if not event.get("error")
+        and event.get("image_url", "")
+        and not event.get("image_url", "").startswith(("data:", "file:"))
+    })
+    prefetched: Dict[str, Optional[str]] = {}
+    if remote_urls:
+        print(f"[ImageGen] Downloading {len(remote_urls)} image(s)...")
+        prefetched = asyncio.run(_download_all(remote_urls))
+
+    # Build all render jobs first, then screenshot them concurrently in a
+    # single browser instead of launching Chromium once per event.
+    render_jobs: List[tuple] = []      # (html, html_path, png_path)
+    render_labels: List[str] = []
+
     for venue, events in processed_events.items():
         if not events:
             continue
@@ -178,14 +447,13 @@ def generate_event_images(
             slug = slugify(title)
             if not slug:
                 slug = "event"
-            filename = f"{slug}.png"
+            filename = f"{slug}.jpg"
 
             original_url = event.get("image_url", "")
-            if original_url and not original_url.startswith("data:"):
-                print(f"[ImageGen] Downloading image for '{title}'...")
-                data_uri = download_image_as_data_uri(original_url)
-                if data_uri:
-                    event = {**event, "image_url": data_uri}
+            if original_url and not original_url.startswith(("data:", "file:")):
+                file_uri = prefetched.get(original_url)
+                if file_uri:
+                    event = {**event, "image_url": file_uri}
                 else:
                     event = {**event, "image_url": ""}
 
@@ -197,15 +465,18 @@ def generate_event_images(
             full_path = venue_dir / filename
             html_path = html_dir / venue / f"{slug}.html"
 
-            try:
-                success, error = render_html_with_playwright(event_html, html_path, full_path)
-                if success:
-                    generated_files.append(str(full_path))
-                    print(f"[ImageGen] Generated: {full_path}")
-                else:
-                    print(f"[ImageGen] ERROR generating image for '{title}': {error}")
-            except Exception as exc:
-                print(f"[ImageGen] ERROR generating image for '{title}': {exc}")
+            render_jobs.append((event_html, html_path, full_path))
+            render_labels.append(title)
+
+    if render_jobs:
+        results = playwright_runtime.run(_render_all(render_jobs))
+        for (_, _, png_path), label, (success, error) in zip(
+                render_jobs, render_labels, results):
+            if success:
+                generated_files.append(str(png_path))
+                print(f"[ImageGen] Generated: {png_path}")
+            else:
+                print(f"[ImageGen] ERROR generating image for '{label}': {error}")
 
     if generate_title:
         all_venues = [v for v in processed_events.keys() if processed_events[v]]
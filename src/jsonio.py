@@ -0,0 +1,34 @@
+"""
+JSON I/O helpers - use orjson when installed, stdlib json otherwise.
+
+orjson serializes straight to bytes roughly 3-5x faster than the stdlib
+encoder, which matters for the markdown-heavy processed-events dumps that
+are rewritten repeatedly during a scraper run. Callers get the same
+behaviour either way: UTF-8 files, non-ASCII preserved, 2-space indent.
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dump_json(data: Any, path: str) -> None:
+    """Write *data* to *path* as indented UTF-8 JSON."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def load_json(path: Any) -> Any:
+    """Read JSON from *path* (str or Path)."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
@@ -0,0 +1,16 @@
+"""
+Event loop setup - installs uvloop when available for faster async I/O.
+
+Importing this module is enough: the libuv-backed event loop policy is
+installed once, before any ``asyncio.run(...)`` call in the entry points.
+Falls back silently to the stock asyncio loop on Windows or when uvloop
+is not installed.
+"""
+import sys
+
+if sys.platform != "win32":
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
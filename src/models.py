@@ -1,7 +1,8 @@
 """
-Models - Pydantic data models for the party scraper.
+Models - data models for the party scraper.
 Reused from src/models.py
 """
+from dataclasses import dataclass
 from typing import List, Optional
 from pydantic import BaseModel, Field
 
@@ -16,6 +17,10 @@ class EventDetail(BaseModel):
     image_url: Optional[str] = Field(None, description="URL hlavního obrázku/plakátu")
 
 
-class ScrapedItem(BaseModel):
+# Parser output is trusted (we build the fields ourselves), so a slots
+# dataclass is enough — no validation pass, no per-instance __dict__.
+# EventDetail stays a pydantic model because it validates Gemini output.
+@dataclass(slots=True)
+class ScrapedItem:
     url: str
     date: Optional[str] = None
@@ -0,0 +1,76 @@
+"""
+Shared lxml DOM helpers for the venue parsers.
+
+Every parser walks one listing page per run but evaluates the same handful
+of CSS selectors for each event card. Parsing with lxml and compiling each
+selector string to an ``etree.XPath`` once keeps the per-card matching in
+lxml's C layer instead of re-interpreting selectors in Python on every call.
+"""
+import re
+from datetime import date
+from functools import lru_cache
+from typing import Optional
+
+from cssselect import HTMLTranslator
+from lxml import etree, html
+
+_TRANSLATOR = HTMLTranslator()
+
+# "DD/MM" dates, shared by the Metro and Perpetuum listings.
+SLASH_DATE_RE = re.compile(r'(\d{1,2})/(\d{1,2})')
+
+
+@lru_cache(maxsize=1)
+def _year_for(today: date) -> int:
+    return today.year
+
+
+def current_year() -> int:
+    """Return the current year, cached per calendar day."""
+    return _year_for(date.today())
+
+
+def parse(html_string: str) -> html.HtmlElement:
+    """Parse an HTML document string into an lxml element tree."""
+    return html.fromstring(html_string)
+
+
+@lru_cache(maxsize=256)
+def compile_sel(css: str) -> etree.XPath:
+    """Compile a CSS selector into a reusable ``etree.XPath``.
+
+    The compiled XPath matches descendants of the element it is called on,
+    mirroring BeautifulSoup's ``select`` semantics.
+    """
+    return etree.XPath(_TRANSLATOR.css_to_xpath(css))
+
+
+def select_one(compiled: etree.XPath, el) -> Optional[html.HtmlElement]:
+    """Return the first match of a compiled selector under *el*, or None."""
+    found = compiled(el)
+    return found[0] if found else None
+
+
+@lru_cache(maxsize=256)
+def compile_text(css: str) -> etree.XPath:
+    """Compile a CSS selector into an XPath returning the first match's text.
+
+    Wrapping the selector in ``string(...)`` makes one C-level evaluation
+    yield the text directly ("" when nothing matches), skipping the element
+    proxy and the follow-up ``text_content()`` call per field.
+    """
+    return etree.XPath(f"string(({_TRANSLATOR.css_to_xpath(css)})[1])")
+
+
+@lru_cache(maxsize=256)
+def compile_ancestor(*class_names) -> etree.XPath:
+    """Compile an XPath matching the nearest ancestor with any of *class_names*.
+
+    One compiled ancestor lookup walks the tree in lxml's C layer, where a
+    per-class ``find_parent``-style loop would re-walk it in Python.
+    """
+    tests = " or ".join(
+        f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+        for name in class_names
+    )
+    return etree.XPath(f"ancestor::*[{tests}][1]")
@@ -0,0 +1,31 @@
+"""
+Month-name lookup tables shared by the venue parsers.
+
+Each table is pre-populated with the lowercase, Titlecase and UPPERCASE
+spellings of every month, so the common case is a single dict hit with no
+per-event Unicode case folding. Callers fall back to ``.lower()`` only on
+a miss (odd mixed-case input).
+"""
+from typing import Dict, List
+
+
+def _with_casings(names: List[str]) -> Dict[str, str]:
+    table = {}
+    for index, name in enumerate(names, start=1):
+        month = f"{index:02d}"
+        for variant in (name, name.title(), name.upper()):
+            table[variant] = month
+    return table
+
+
+# Czech month names as used by fleda.cz and patrobrno.cz.
+CZ_MONTH_MAP = _with_casings([
+    "leden", "únor", "březen", "duben", "květen", "červen",
+    "červenec", "srpen", "září", "říjen", "listopad", "prosinec",
+])
+
+# Three-letter English abbreviations as used by ra.co.
+EN_MONTH_MAP = _with_casings([
+    "jan", "feb", "mar", "apr", "may", "jun",
+    "jul", "aug", "sep", "oct", "nov", "dec",
+])
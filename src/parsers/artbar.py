@@ -3,55 +3,62 @@ Artbar parser - extracts event URLs and dates from artbar.club
 Ported from frontend/src/parsers/artbar.ts
 """
 import re
-from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
 
+from ._dom import compile_ancestor, compile_sel, compile_text, current_year, parse, select_one
 
-def format_czech_date(date_str: Optional[str]) -> Optional[str]:
-    """Convert Czech date format 'DD. MM.' to 'YYYY-MM-DD'."""
-    if not date_str:
-        return None
-    match = re.search(r'(\d+)\.\s*(\d+)\.', date_str)
+_RSVP_BUTTONS = compile_sel('a[data-hook="ev-rsvp-button"]')
+_SHORT_DATE_TEXT = compile_text('[data-hook="short-date"]')
+_CONTAINER = compile_ancestor("TYl3A7", "LbqWhj")
+_CZ_DATE_RE = re.compile(r'(\d+)\.\s*(\d+)\.')
+
+
+@lru_cache(maxsize=1024)
+def _format_czech_date(date_str: str, year: int) -> str:
+    match = _CZ_DATE_RE.search(date_str)
     if not match:
         return date_str
     day = match.group(1).zfill(2)
     month = match.group(2).zfill(2)
-    year = datetime.now().year
     return f"{year}-{month}-{day}"
 
 
+def format_czech_date(date_str: Optional[str]) -> Optional[str]:
+    """Convert Czech date format 'DD. MM.' to 'YYYY-MM-DD'.
+
+    Listings repeat the same raw date across many cards, so results are
+    memoized per (string, year).
+    """
+    if not date_str:
+        return None
+    return _format_czech_date(date_str, current_year())
+
+
 def artbar_parser(html_string: str) -> List[Dict[str, Optional[str]]]:
     """
     Parse Artbar event listing page.
     Looks for links with data-hook="ev-rsvp-button" and extracts URL + date.
     """
-    soup = BeautifulSoup(html_string, "html.parser")
-    events = []
-    seen_urls = set()
-
-    buttons = soup.select('a[data-hook="ev-rsvp-button"]')
-    for btn in buttons:
-        href = btn.get("href", "")
-        if not href:
+    tree = parse(html_string)
+    events = {}
+
+    for btn in _RSVP_BUTTONS(tree):
+        url = btn.get("href", "")
+        if not url or url in events:
             continue
 
         # Find the container (parent elements)
-        container = btn.find_parent(class_="TYl3A7") or btn.find_parent(class_="LbqWhj") or btn.parent
+        container = select_one(_CONTAINER, btn)
+        if container is None:
+            container = btn.getparent()
         raw_date = None
-        if container:
-            date_el = container.select_one('[data-hook="short-date"]')
-            if date_el:
-                raw_date = date_el.get_text(strip=True)
-
-        url = href
-        if url in seen_urls:
-            continue
-        seen_urls.add(url)
+        if container is not None:
+            raw_date = _SHORT_DATE_TEXT(container).strip()
 
-        events.append({
+        events[url] = {
             "url": url,
             "date": format_czech_date(raw_date),
-        })
+        }
 
-    return events
+    return list(events.values())
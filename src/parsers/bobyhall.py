@@ -4,7 +4,11 @@ Ported from frontend/src/parsers/bobyhall.ts
 """
 import re
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+
+from ._dom import compile_sel, parse
+
+_EVENT_LINKS = compile_sel(".fusion-grid-posts-cards .fusion-title-heading a")
+_BOBY_DATE_RE = re.compile(r'(\d{1,2})\.\s*(\d{1,2})\.\s*(\d{4})')
 
 
 def bobyhall_parser(html_string: str) -> List[Dict[str, Optional[str]]]:
@@ -13,21 +17,20 @@ def bobyhall_parser(html_string: str) -> List[Dict[str, Optional[str]]]:
     Looks for links in .fusion-grid-posts-cards .fusion-title-heading a
     Extracts title and date from text format "Title | DD. MM. YYYY"
     """
-    soup = BeautifulSoup(html_string, "html.parser")
+    tree = parse(html_string)
     items = []
 
-    event_links = soup.select(".fusion-grid-posts-cards .fusion-title-heading a")
-    for link in event_links:
-        full_text = link.get_text(strip=False) or ""
+    for link in _EVENT_LINKS(tree):
+        full_text = link.text_content() or ""
         if "|" not in full_text:
             continue
 
-        parts = [p.strip() for p in full_text.split("|")]
-        raw_date = parts[1] if len(parts) > 1 else None
+        _, sep, after = full_text.partition("|")
+        raw_date = after.strip() if sep else None
 
         date_str = None
         if raw_date:
-            match = re.search(r'(\d{1,2})\.\s*(\d{1,2})\.\s*(\d{4})', raw_date)
+            match = _BOBY_DATE_RE.search(raw_date)
             if match:
                 day = match.group(1).zfill(2)
                 month = match.group(2).zfill(2)
@@ -3,13 +3,24 @@ Fléda parser - extracts event URLs and dates from fleda.cz
 Ported from frontend/src/parsers/fleda.ts
 """
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
 
-MONTH_MAP = {
-    "leden": "01", "únor": "02", "březen": "03", "duben": "04",
-    "květen": "05", "červen": "06", "červenec": "07", "srpen": "08",
-    "září": "09", "říjen": "10", "listopad": "11", "prosinec": "12",
-}
+from ._dom import compile_sel, compile_text, parse, select_one
+from ._months import CZ_MONTH_MAP
+
+_BASE_URL = "https://www.fleda.cz"
+
+_PROGRAM_ARCHIVE = compile_sel(".program-archive")
+_IMG_LINK = compile_sel("a.img")
+_TITLE_SELECTORS = (
+    compile_sel("h3 a"),
+    compile_sel("h3"),
+    compile_sel("h2 a"),
+    compile_sel(".info h3"),
+)
+_DATE = compile_sel(".date")
+_DAY_TEXT = compile_text(".num")
+_MONTH_TEXT = compile_text(".month")
+_YEAR_TEXT = compile_text(".year")
 
 
 def fleda_parser(html_string: str) -> List[Dict[str, Optional[str]]]:
@@ -17,49 +28,46 @@ def fleda_parser(html_string: str) -> List[Dict[str, Optional[str]]]:
     Parse Fléda event listing page.
     Looks for events in .program-archive > div > div with a.img links.
     """
-    soup = BeautifulSoup(html_string, "html.parser")
+    tree = parse(html_string)
     items = []
 
-    program_archive = soup.select_one(".program-archive")
-    if not program_archive:
+    program_archive = select_one(_PROGRAM_ARCHIVE, tree)
+    if program_archive is None:
         return items
 
     # Select direct children divs, then their children divs
-    outer_divs = program_archive.find_all("div", recursive=False)
     event_elements = []
-    for outer in outer_divs:
-        inner_divs = outer.find_all("div", recursive=False)
-        event_elements.extend(inner_divs)
+    for outer in program_archive.findall("div"):
+        event_elements.extend(outer.findall("div"))
 
     for el in event_elements:
-        link_el = el.select_one("a.img")
-        if not link_el:
+        link_el = select_one(_IMG_LINK, el)
+        if link_el is None:
             continue
 
         # Find title
-        title_el = (
-            el.select_one("h3 a") or el.select_one("h3")
-            or el.select_one("h2 a") or el.select_one(".info h3")
-        )
-        title = title_el.get_text(strip=True) if title_el else ""
+        title_el = None
+        for selector in _TITLE_SELECTORS:
+            title_el = select_one(selector, el)
+            if title_el is not None:
+                break
+        title = title_el.text_content().strip() if title_el is not None else ""
         if not title:
             continue
 
         url = link_el.get("href", "")
         if url and not url.startswith("http"):
-            url = f"https://www.fleda.cz{'/' if not url.startswith('/') else ''}{url}"
+            url = _BASE_URL + url if url.startswith("/") else _BASE_URL + "/" + url
 
         date_str = None
-        date_el = el.select_one(".date")
-        if date_el:
-            day_el = date_el.select_one(".num")
-            month_el = date_el.select_one(".month")
-            year_el = date_el.select_one(".year")
-
-            day_num = day_el.get_text(strip=True).zfill(2) if day_el else None
-            month_name = month_el.get_text(strip=True).lower() if month_el else ""
-            year_num = year_el.get_text(strip=True) if year_el else None
-            month_num = MONTH_MAP.get(month_name)
+        date_el = select_one(_DATE, el)
+        if date_el is not None:
+            day_text = _DAY_TEXT(date_el).strip()
+            day_num = day_text.zfill(2) if day_text else None
+            month_name = _MONTH_TEXT(date_el).strip()
+            year_num = _YEAR_TEXT(date_el).strip()
+            month_num = (CZ_MONTH_MAP.get(month_name)
+                         or CZ_MONTH_MAP.get(month_name.lower()))
 
             if day_num and month_num and year_num:
                 date_str = f"{year_num}-{month_num}-{day_num}"
@@ -3,53 +3,60 @@ Kabinet Múz parser - extracts event URLs and dates from kabinetmuz.cz
 Ported from frontend/src/parsers/kabinet.ts
 """
 import re
-from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+
+from ._dom import compile_sel, compile_text, current_year, parse
 
 BASE_URL = "https://www.kabinetmuz.cz"
 
+_PROGRAM_ITEMS = compile_sel(".program__items a.program__item")
+_PROGRAM_DATE_TEXT = compile_text(".program__date")
+_KABINET_DATE_RE = re.compile(r'(\d+)\.\s+(\d+)\.')
 
-def format_kabinet_date(date_str: Optional[str]) -> Optional[str]:
-    """Convert date format 'DD. MM.' to 'YYYY-MM-DD'."""
-    if not date_str:
-        return None
-    match = re.search(r'(\d+)\.\s+(\d+)\.', date_str)
+
+@lru_cache(maxsize=1024)
+def _format_kabinet_date(date_str: str, year: int) -> Optional[str]:
+    match = _KABINET_DATE_RE.search(date_str)
     if not match:
         return None
     day = match.group(1).zfill(2)
     month = match.group(2).zfill(2)
-    year = datetime.now().year
     return f"{year}-{month}-{day}"
 
 
+def format_kabinet_date(date_str: Optional[str]) -> Optional[str]:
+    """Convert date format 'DD. MM.' to 'YYYY-MM-DD'.
+
+    Memoized per (string, year) — listings repeat the same raw date.
+    """
+    if not date_str:
+        return None
+    return _format_kabinet_date(date_str, current_year())
+
+
 def kabinet_parser(html_string: str) -> List[Dict[str, Optional[str]]]:
     """
     Parse Kabinet Múz event listing page.
     Looks for a.program__item links within .program__items.
     """
-    soup = BeautifulSoup(html_string, "html.parser")
-    events = []
-    seen_urls = set()
+    tree = parse(html_string)
+    events = {}
 
-    items = soup.select(".program__items a.program__item")
-    for el in items:
+    for el in _PROGRAM_ITEMS(tree):
         href = el.get("href", "")
         if not href:
             continue
 
         url = href if href.startswith("http") else BASE_URL + href
-
-        date_el = el.select_one(".program__date")
-        raw_date = date_el.get_text(strip=True) if date_el else None
-
-        if url in seen_urls:
+        if url in events:
             continue
-        seen_urls.add(url)
 
-        events.append({
+        raw_date = _PROGRAM_DATE_TEXT(el).strip()
+
+        events[url] = {
             "url": url,
             "date": format_kabinet_date(raw_date),
-        })
+        }
 
-    return events
+    return list(events.values())
@@ -2,10 +2,16 @@
 Metro Music Bar parser - extracts event URLs and dates from metromusic.cz
 Ported from frontend/src/parsers/metro.ts
 """
-import re
-from datetime import datetime
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+
+from ._dom import SLASH_DATE_RE, compile_sel, current_year, parse, select_one
+
+_EVENT_ELEMENTS = compile_sel(
+    "#form-ajax-content div.item, #form-ajax-content .item-inner, .program .item"
+)
+_LINK = compile_sel("a")
+_TITLE = compile_sel("h2, h3, .title")
+_DATE = compile_sel("p.date")
 
 
 def metro_parser(html_string: str) -> List[Dict[str, Optional[str]]]:
@@ -13,57 +19,48 @@ def metro_parser(html_string: str) -> List[Dict[str, Optional[str]]]:
     Parse Metro Music Bar event listing page.
     Looks for event items in #form-ajax-content or .program sections.
     """
-    soup = BeautifulSoup(html_string, "html.parser")
-    items = []
-    seen_urls = set()
+    tree = parse(html_string)
+    items = {}
 
-    event_elements = soup.select(
-        "#form-ajax-content div.item, #form-ajax-content .item-inner, .program .item"
-    )
-
-    for el in event_elements:
-        link_el = el.select_one("a")
-        if not link_el:
+    for el in _EVENT_ELEMENTS(tree):
+        link_el = select_one(_LINK, el)
+        if link_el is None:
             continue
 
         url = link_el.get("href", "")
-        if not url or url == "#":
+        if not url or url == "#" or url in items:
             continue
 
         # Find title
-        title_el = el.select_one("h2, h3, .title")
-        date_el = el.select_one("p.date")
+        title_el = select_one(_TITLE, el)
+        date_el = select_one(_DATE, el)
 
         title = ""
-        if title_el:
-            title = title_el.get_text(strip=True)
+        if title_el is not None:
+            title = title_el.text_content().strip()
         else:
             # Fallback: first line of link text
-            link_text = link_el.get_text(strip=False)
+            link_text = link_el.text_content()
             if link_text:
                 title = link_text.split("\n")[0].strip()
 
         if not title:
             continue
 
-        date_str = None
         date_source = ""
-        if date_el:
-            date_source = date_el.get_text(strip=False)
+        if date_el is not None:
+            date_source = date_el.text_content()
         else:
-            date_source = link_el.get_text(strip=False) or ""
+            date_source = link_el.text_content() or ""
 
-        match = re.search(r'(\d{1,2})/(\d{1,2})', date_source)
+        date_str = None
+        match = SLASH_DATE_RE.search(date_source)
         if match:
             day = match.group(1).zfill(2)
             month = match.group(2).zfill(2)
-            year = datetime.now().year
+            year = current_year()
             date_str = f"{year}-{month}-{day}"
 
-        if url in seen_urls:
-            continue
-        seen_urls.add(url)
-
-        items.append({"date": date_str, "url": url})
+        items[url] = {"date": date_str, "url": url}
 
-    return items
+    return list(items.values())
@@ -2,15 +2,17 @@
 První patro parser - extracts event URLs and dates from patrobrno.cz
 Ported from frontend/src/parsers/patro.ts
 """
-from datetime import datetime
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
 
-MONTH_MAP = {
-    "leden": "01", "únor": "02", "březen": "03", "duben": "04",
-    "květen": "05", "červen": "06", "červenec": "07", "srpen": "08",
-    "září": "09", "říjen": "10", "listopad": "11", "prosinec": "12",
-}
+from ._dom import compile_sel, compile_text, current_year, parse, select_one
+from ._months import CZ_MONTH_MAP
+
+_EVENT_ARTICLES = compile_sel(".event-list article")
+_EVENT_LINK = compile_sel("a.event__link")
+_TITLE = compile_sel("h2")
+_EVENT_DATE = compile_sel(".event__date")
+_EVENT_DAY_TEXT = compile_text(".event__day")
+_EVENT_MONTH_TEXT = compile_text(".event__month")
 
 
 def patro_parser(html_string: str) -> List[Dict[str, Optional[str]]]:
@@ -18,38 +20,30 @@ def patro_parser(html_string: str) -> List[Dict[str, Optional[str]]]:
     Parse První patro event listing page.
     Looks for articles in .event-list with a.event__link.
     """
-    soup = BeautifulSoup(html_string, "html.parser")
+    tree = parse(html_string)
     items = []
 
-    event_articles = soup.select(".event-list article")
-    for article in event_articles:
-        link_el = article.select_one("a.event__link")
-        title_el = article.select_one("h2")
-        date_el = article.select_one(".event__date")
+    for article in _EVENT_ARTICLES(tree):
+        link_el = select_one(_EVENT_LINK, article)
+        title_el = select_one(_TITLE, article)
+        date_el = select_one(_EVENT_DATE, article)
 
-        if not link_el or not title_el:
+        if link_el is None or title_el is None:
             continue
 
         url = link_el.get("href", "")
 
         date_str = None
-        if date_el:
-            day_el = date_el.select_one(".event__day")
-            month_el = date_el.select_one(".event__month")
-
-            day_text = ""
-            if day_el:
-                day_text = day_el.get_text(strip=True).replace(".", "")
-
-            month_text = ""
-            if month_el:
-                month_text = month_el.get_text(strip=True).lower()
+        if date_el is not None:
+            day_text = _EVENT_DAY_TEXT(date_el).strip().replace(".", "")
+            month_text = _EVENT_MONTH_TEXT(date_el).strip()
 
             day = day_text.zfill(2) if day_text else ""
-            month = MONTH_MAP.get(month_text, "")
+            month = (CZ_MONTH_MAP.get(month_text)
+                     or CZ_MONTH_MAP.get(month_text.lower(), ""))
 
             if day and month:
-                year = datetime.now().year
+                year = current_year()
                 date_str = f"{year}-{month}-{day}"
 
         items.append({"date": date_str, "url": url})
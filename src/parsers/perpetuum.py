@@ -2,10 +2,15 @@
 Perpetuum parser - extracts event URLs and dates from perpetuumklub.cz
 Ported from frontend/src/parsers/perpetuum.ts
 """
-import re
-from datetime import datetime
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+
+from ._dom import SLASH_DATE_RE, compile_sel, compile_text, current_year, parse, select_one
+
+_BASE_URL = "https://www.perpetuumklub.cz"
+
+_EVENT_LINKS = compile_sel("a.block-link")
+_TITLE = compile_sel(".event_title")
+_DATE_TEXT = compile_text(".event_date")
 
 
 def perpetuum_parser(html_string: str) -> List[Dict[str, Optional[str]]]:
@@ -13,29 +18,26 @@ def perpetuum_parser(html_string: str) -> List[Dict[str, Optional[str]]]:
     Parse Perpetuum event listing page.
     Looks for a.block-link with .event_title and .event_date.
     """
-    soup = BeautifulSoup(html_string, "html.parser")
+    tree = parse(html_string)
     items = []
 
-    event_links = soup.select("a.block-link")
-    for link in event_links:
-        title_el = link.select_one(".event_title")
-        date_el = link.select_one(".event_date")
-
-        if not title_el:
+    for link in _EVENT_LINKS(tree):
+        title_el = select_one(_TITLE, link)
+        if title_el is None:
             continue
 
         url = link.get("href", "")
         if url and not url.startswith("http"):
-            url = f"https://www.perpetuumklub.cz{'/' if not url.startswith('/') else ''}{url}"
+            url = _BASE_URL + url if url.startswith("/") else _BASE_URL + "/" + url
 
         date_str = None
-        if date_el:
-            raw_date = date_el.get_text(strip=True)
-            match = re.search(r'(\d{1,2})/(\d{1,2})', raw_date)
+        raw_date = _DATE_TEXT(link).strip()
+        if raw_date:
+            match = SLASH_DATE_RE.search(raw_date)
             if match:
                 day = match.group(1).zfill(2)
                 month = match.group(2).zfill(2)
-                year = datetime.now().year
+                year = current_year()
                 date_str = f"{year}-{month}-{day}"
 
         items.append({"date": date_str, "url": url})
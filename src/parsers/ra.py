@@ -3,15 +3,16 @@ Resident Advisor (RA) parser - extracts event URLs and dates from ra.co
 Ported from frontend/src/parsers/ra.ts
 """
 import re
-from datetime import datetime
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
 
-RA_MONTH_MAP = {
-    "jan": "01", "feb": "02", "mar": "03", "apr": "04",
-    "may": "05", "jun": "06", "jul": "07", "aug": "08",
-    "sep": "09", "oct": "10", "nov": "11", "dec": "12",
-}
+from ._dom import compile_sel, compile_text, current_year, parse, select_one
+from ._months import EN_MONTH_MAP
+
+_EVENT_CARDS = compile_sel('[data-testid="event-listing-card"]')
+_TITLE_LINK = compile_sel('[data-pw-test-id="event-title"] a, h3 a')
+_DATE_TEXT = compile_text('span[color="secondary"]')
+_DATE_FALLBACK_TEXT = compile_text(".Text-sc-wks9sf-0.dhcUaC")
+_RA_DATE_RE = re.compile(r'(\d{1,2})\s+([a-zA-Z]{3})')
 
 
 def ra_parser(html_string: str) -> List[Dict[str, Optional[str]]]:
@@ -19,17 +20,13 @@ def ra_parser(html_string: str) -> List[Dict[str, Optional[str]]]:
     Parse Resident Advisor event listing page.
     Looks for event cards with data-testid="event-listing-card".
     """
-    soup = BeautifulSoup(html_string, "html.parser")
+    tree = parse(html_string)
     items = []
 
-    event_cards = soup.select('[data-testid="event-listing-card"]')
-    for card in event_cards:
+    for card in _EVENT_CARDS(tree):
         # Find title link
-        title_el = (
-            card.select_one('[data-pw-test-id="event-title"] a')
-            or card.select_one("h3 a")
-        )
-        if not title_el:
+        title_el = select_one(_TITLE_LINK, card)
+        if title_el is None:
             continue
 
         url = title_el.get("href", "")
@@ -37,21 +34,18 @@ def ra_parser(html_string: str) -> List[Dict[str, Optional[str]]]:
             url = f"https://ra.co{url}"
 
         # Find date
-        date_el = (
-            card.select_one('span[color="secondary"]')
-            or card.select_one(".Text-sc-wks9sf-0.dhcUaC")
-        )
+        raw_date = _DATE_TEXT(card).strip() or _DATE_FALLBACK_TEXT(card).strip()
 
         date_str = None
-        if date_el:
-            raw_date = date_el.get_text(strip=True)
-            match = re.search(r'(\d{1,2})\s+([a-zA-Z]{3})', raw_date)
+        if raw_date:
+            match = _RA_DATE_RE.search(raw_date)
             if match:
                 day = match.group(1).zfill(2)
-                month_name = match.group(2).lower()
-                month = RA_MONTH_MAP.get(month_name)
+                month_name = match.group(2)
+                month = (EN_MONTH_MAP.get(month_name)
+                         or EN_MONTH_MAP.get(month_name.lower()))
                 if month:
-                    year = datetime.now().year
+                    year = current_year()
                     date_str = f"{year}-{month}-{day}"
 
         items.append({"date": date_str, "url": url})
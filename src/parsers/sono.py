@@ -3,15 +3,27 @@ Sono Music Club parser - extracts event URLs and dates from sono.cz
 Ported from frontend/src/parsers/sono.ts
 """
 import re
+from functools import lru_cache
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
 
+from ._dom import compile_ancestor, compile_sel, compile_text, parse, select_one
 
+_EVENT_LINKS = compile_sel("a.link")
+_DATE_TEXT = compile_text("p.date")
+_CONTAINER = compile_ancestor("item", "post")
+_SONO_DATE_RE = re.compile(r'(\d+)\.(\d+)\.(\d+)')
+
+
+@lru_cache(maxsize=1024)
 def format_sono_date(date_str: Optional[str]) -> Optional[str]:
-    """Convert date format 'DD.MM.YYYY' to 'YYYY-MM-DD'."""
+    """Convert date format 'DD.MM.YYYY' to 'YYYY-MM-DD'.
+
+    The input already carries its year, so results memoize on the raw
+    string alone.
+    """
     if not date_str:
         return None
-    match = re.search(r'(\d+)\.(\d+)\.(\d+)', date_str)
+    match = _SONO_DATE_RE.search(date_str)
     if not match:
         return None
     day = match.group(1).zfill(2)
@@ -25,32 +37,25 @@ def sono_parser(html_string: str) -> List[Dict[str, Optional[str]]]:
     Parse Sono Music Club event listing page.
     Looks for a.link elements and finds dates from parent containers.
     """
-    soup = BeautifulSoup(html_string, "html.parser")
-    events = []
-    seen_urls = set()
-
-    items = soup.select("a.link")
-    for el in items:
-        href = el.get("href", "")
-        if not href:
+    tree = parse(html_string)
+    events = {}
+
+    for el in _EVENT_LINKS(tree):
+        url = el.get("href", "")
+        if not url or url in events:
             continue
 
         # Find parent container
-        container = el.find_parent(class_="item") or el.find_parent(class_="post") or el.parent
+        container = select_one(_CONTAINER, el)
+        if container is None:
+            container = el.getparent()
         raw_date = None
-        if container:
-            date_el = container.select_one("p.date")
-            if date_el:
-                raw_date = date_el.get_text(strip=True)
-
-        url = href
-        if url in seen_urls:
-            continue
-        seen_urls.add(url)
+        if container is not None:
+            raw_date = _DATE_TEXT(container).strip()
 
-        events.append({
+        events[url] = {
             "url": url,
             "date": format_sono_date(raw_date),
-        })
+        }
 
-    return events
+    return list(events.values())
@@ -2,16 +2,19 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import os
 import random
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from functools import partial
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Any, Dict, Iterable, Optional
 
 from .ai_scraper import process_all_events
 from .config import get_config
+from .jsonio import load_json
 from .event_parser import (
     get_venues,
     filter_today_only,
@@ -25,77 +28,116 @@ from .ig_post import upload_media
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 
+# Image types accepted when scanning output directories by file name.
+_IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg"}
+
+
+# Cached (config object, name) pair; revalidated by identity so a re-init
+# with another city is picked up without re-reading config per path access.
+_city_cache: Optional[tuple[Any, str]] = None
+
 
 def _city_name() -> str:
     """Return the active city slug for directory isolation."""
+    global _city_cache
     try:
-        return get_config().name
+        cfg = get_config()
     except RuntimeError:
         return "default"
+    if _city_cache is None or _city_cache[0] is not cfg:
+        _city_cache = (cfg, cfg.name)
+    return _city_cache[1]
 
 
 # ── city-scoped paths ─────────────────────────────────────────────────────
 # Each city gets its own subdirectory under temp/ and generated/ so that
-# running two cities in parallel never conflicts.
+# running two cities in parallel never conflicts. The Path objects are
+# built once per city and cached — the helpers below are called in
+# per-image loops and each call used to re-read the config and rebuild
+# the whole Path chain.
+
+
+@dataclass(frozen=True)
+class _CityPaths:
+    temp_dir: Path
+    fetched_events: Path
+    processed_events: Path
+    generated_images_dir: Path
+    post_dir: Path
+
+
+@lru_cache(maxsize=None)
+def _paths_for(city: str) -> _CityPaths:
+    temp_dir = PROJECT_ROOT / "temp" / city
+    return _CityPaths(
+        temp_dir=temp_dir,
+        fetched_events=temp_dir / "fetched-events.json",
+        processed_events=temp_dir / "processed-events.json",
+        generated_images_dir=PROJECT_ROOT / "generated" / city / "images",
+        post_dir=temp_dir / "post",
+    )
 
 
 def _get_temp_dir() -> Path:
-    return PROJECT_ROOT / "temp" / _city_name()
+    return _paths_for(_city_name()).temp_dir
 
 
 def _get_fetched_events_path() -> Path:
-    return _get_temp_dir() / "fetched-events.json"
+    return _paths_for(_city_name()).fetched_events
 
 
 def _get_processed_events_path() -> Path:
-    return _get_temp_dir() / "processed-events.json"
+    return _paths_for(_city_name()).processed_events
 
 
 def _get_generated_images_dir() -> Path:
-    return PROJECT_ROOT / "generated" / _city_name() / "images"
+    return _paths_for(_city_name()).generated_images_dir
 
 
 def _get_post_dir() -> Path:
-    return _get_temp_dir() / "post"
-
-
-# Backwards-compatible module-level aliases (read lazily)
-class _LazyPath:
-    """Descriptor that calls a factory each time it's accessed."""
-    def __init__(self, factory):
-        self._factory = factory
-    def __repr__(self):
-        return str(self._factory())
-    def __fspath__(self):
-        return str(self._factory())
-    def __str__(self):
-        return str(self._factory())
-    def __truediv__(self, other):
-        return self._factory() / other
-    @property
-    def parent(self):
-        return self._factory().parent
-    def exists(self):
-        return self._factory().exists()
-    def mkdir(self, **kw):
-        return self._factory().mkdir(**kw)
-    def open(self, *a, **kw):
-        return self._factory().open(*a, **kw)
-    def iterdir(self):
-        return self._factory().iterdir()
-    def is_dir(self):
-        return self._factory().is_dir()
-
-
-TEMP_DIR = _LazyPath(_get_temp_dir)
-FETCHED_EVENTS_PATH = _LazyPath(_get_fetched_events_path)
-PROCESSED_EVENTS_PATH = _LazyPath(_get_processed_events_path)
-GENERATED_IMAGES_DIR = _LazyPath(_get_generated_images_dir)
-POST_DIR = _LazyPath(_get_post_dir)
+    return _paths_for(_city_name()).post_dir
+
+
+# Backwards-compatible module-level aliases. Resolved via PEP 562 module
+# __getattr__ so the attribute access returns a real (cached) Path — every
+# subsequent operation on it is a native Path operation, with none of the
+# per-call proxy indirection the old _LazyPath wrapper added.
+_LEGACY_PATHS = {
+    "TEMP_DIR": _get_temp_dir,
+    "FETCHED_EVENTS_PATH": _get_fetched_events_path,
+    "PROCESSED_EVENTS_PATH": _get_processed_events_path,
+    "GENERATED_IMAGES_DIR": _get_generated_images_dir,
+    "POST_DIR": _get_post_dir,
+}
+
+
+def __getattr__(name: str) -> Path:
+    try:
+        return _LEGACY_PATHS[name]()
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}") from None
+
+
+# Directories already created this run; mkdir is skipped for them. Every
+# rmtree call site must call _forget_dir so re-creation isn't skipped.
+_created_dirs: set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    if path not in _created_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _created_dirs.add(path)
+
+
+def _forget_dir(path: Path) -> None:
+    global _created_dirs
+    _created_dirs = {
+        d for d in _created_dirs if d != path and path not in d.parents}
 
 
 def _ensure_temp_dir() -> None:
-    _get_temp_dir().mkdir(parents=True, exist_ok=True)
+    _ensure_dir(_get_temp_dir())
 
 
 def run_setup_step() -> bool:
@@ -108,7 +150,10 @@ async def fetch_and_parse_events(
 ) -> Dict[str, list[dict[str, Any]]]:
     """Fetch HTML from venues, parse the events, and save the JSON snapshot."""
     html_results = await fetch_all_venues(get_venues())
-    fetched_events = parse_all_venues(
+    # Parsing is CPU-bound (lxml); keep it off the event loop so pending
+    # tasks (Discord heartbeats, fetch teardown) aren't stalled behind it.
+    fetched_events = await asyncio.to_thread(
+        parse_all_venues,
         html_results, filter_past=filter_past, max_results=max_results)
 
     _ensure_temp_dir()
@@ -123,8 +168,7 @@ def load_fetched_events() -> Dict[str, list[dict[str, Any]]]:
         raise FileNotFoundError(
             f"Missing fetched events file: {path}")
 
-    with path.open("r", encoding="utf-8") as fh:
-        return json.load(fh)
+    return load_json(path)
 
 
 def build_today_events(
@@ -157,8 +201,7 @@ def load_processed_events() -> Dict[str, list[dict[str, Any]]]:
         raise FileNotFoundError(
             f"Missing processed events file: {path}")
 
-    with path.open("r", encoding="utf-8") as fh:
-        return json.load(fh)
+    return load_json(path)
 
 
 def generate_images_from_processed(
@@ -182,7 +225,7 @@ def generate_images_from_processed(
     if images_dir is None:
         images_dir = _get_generated_images_dir()
 
-    images_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(images_dir)
     return generate_event_images(processed_events, str(images_dir), generate_title=generate_title)
 
 
@@ -200,9 +243,9 @@ def generate_title_from_venues(
     if images_dir is None:
         images_dir = _get_generated_images_dir()
 
-    images_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(images_dir)
     html_dir = images_dir / "html"
-    html_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(html_dir)
 
     venues_list = list(venues)
     venues_str = " | ".join(venues_list)
@@ -210,18 +253,28 @@ def generate_title_from_venues(
     tomorrow = datetime.now() + timedelta(days=1)
     date_display = f"{tomorrow.day:02d}. {tomorrow.month:02d}."
 
-    # pick a random existing PNG from the approved venues as backdrop
-    background_candidates: list[str] = []
+    # pick a random existing image from the approved venues as backdrop.
+    # Single-pass reservoir sample (k=1): the i-th image seen replaces the
+    # pick with probability 1/i, so no candidate list is materialized.
+    # scandir filters on entry names alone — no per-entry stat and no
+    # Path object unless the entry is actually an image.
+    chosen: Optional[str] = None
+    seen = 0
     for v in venues_list:
         venue_path = images_dir / v
-        if venue_path.is_dir():
-            for p in venue_path.glob("*.png"):
-                background_candidates.append(str(p.as_posix()))
+        try:
+            with os.scandir(venue_path) as entries:
+                for e in entries:
+                    if os.path.splitext(e.name)[1].lower() in _IMAGE_SUFFIXES:
+                        seen += 1
+                        if random.random() * seen < 1:
+                            chosen = (venue_path / e.name).as_posix()
+        except (FileNotFoundError, NotADirectoryError):
+            continue
 
     cfg = get_config()
     background_html = ""
-    if background_candidates:
-        chosen = random.choice(background_candidates)
+    if chosen is not None:
         background_html = (
             f'<img src="{chosen}" class="background-image" alt="{cfg.title_alt}" />'
         )
@@ -266,22 +319,31 @@ def _finalize_post(approved_images: list[str]) -> None:
     src_html = images_dir / "html"
     if src_html.exists():
         shutil.rmtree(src_html)
+        _forget_dir(src_html)
         print("[Pipeline] Deleted generated HTML")
 
-    # copy title-post first
+    # collect (src, dest) pairs: title-post first, then approved images
+    copies: list[tuple[Path, Path]] = []
     title_src = images_dir / "title-post.png"
-    if title_src.exists():
-        shutil.copy2(str(title_src), str(post_dir / "title-post.png"))
-        print(f"[Pipeline] Copied title-post.png to {post_dir}")
+    has_title = title_src.exists()
+    if has_title:
+        copies.append((title_src, post_dir / "title-post.png"))
 
-    # copy approved event images
     for rel_path in approved_images:
         src = images_dir / rel_path
         if src.exists():
-            dest = post_dir / Path(rel_path).name
-            shutil.copy2(str(src), str(dest))
+            copies.append((src, post_dir / Path(rel_path).name))
+
+    # The copies are independent and shutil releases the GIL inside the
+    # kernel copy, so overlapping them scales with disk bandwidth.
+    if copies:
+        with ThreadPoolExecutor(max_workers=min(8, len(copies))) as executor:
+            list(executor.map(lambda pair: shutil.copy2(*pair), copies))
+    if has_title:
+        print(f"[Pipeline] Copied title-post.png to {post_dir}")
 
-    count = len(list(post_dir.iterdir()))
+    with os.scandir(post_dir) as entries:
+        count = sum(1 for _ in entries)
     print(f"[Pipeline] {count} file(s) ready in {post_dir}")
 
 
@@ -290,6 +352,7 @@ def _cleanup_generated_images() -> None:
     generated_root = _get_generated_images_dir().parent  # generated/<city>/
     if generated_root.exists():
         shutil.rmtree(generated_root)
+        _forget_dir(generated_root)
         print(f"[Pipeline] Cleaned up {generated_root}")
 
 
@@ -305,24 +368,39 @@ async def morning_flow() -> None:
     await fetch_and_parse_events()
 
     # 3. Filter tomorrow's events + AI-process
-    build_today_events()
-    await process_today_events()
+    today_events = build_today_events()
+    await process_today_events(today_events)
 
     # 4. Clean previous generated images so only today's run is in the poll
     gen_dir = _get_generated_images_dir()
     if gen_dir.exists():
-        shutil.rmtree(gen_dir)
+        await asyncio.to_thread(shutil.rmtree, gen_dir)
+        _forget_dir(gen_dir)
         print("[Pipeline] Cleaned previous generated images.")
 
-    # 5. Generate event images only (sync Playwright — run outside async loop)
+    # 5. Generate event images only (sync Playwright — run outside async
+    # loop). The Discord config warms up concurrently so send_poll below
+    # doesn't pay the .env + config parse after rendering finishes; any
+    # config problem is swallowed here and surfaces properly in send_poll.
+    from .discord_utils import load_discord_config
+    from .review_images import send_poll
+
+    async def _warm_discord_config() -> None:
+        try:
+            await asyncio.to_thread(load_discord_config)
+        except Exception:
+            # A failed warm-up is harmless: load_discord_config simply runs
+            # again (uncached) when send_poll needs it.
+            pass
+
     loop = asyncio.get_running_loop()
-    await loop.run_in_executor(
-        None, partial(generate_images_from_processed, generate_title=False)
+    await asyncio.gather(
+        loop.run_in_executor(
+            None, partial(generate_images_from_processed, generate_title=False)
+        ),
+        _warm_discord_config(),
     )
 
-    # 5. Send Discord poll (exits immediately, poll stays open)
-    from .review_images import send_poll
-
     print("\n[Pipeline] Sending Discord review poll...")
     await send_poll(_get_generated_images_dir(), _get_temp_dir())
     print("[Pipeline] Morning flow complete. Poll is open for voting.")
@@ -346,8 +424,10 @@ async def post_flow() -> None:
     # 7. Generate title from approved venues only
     print("\n[Pipeline] Generating title image from approved venues...")
     if approved_images:
+        # Approved paths are always "/"-joined, so a plain split beats
+        # building a Path object per entry just to read its first part.
         approved_venues = {
-            Path(p).parts[0] for p in approved_images if "/" in p
+            p.split("/", 1)[0] for p in approved_images if "/" in p
         }
         if approved_venues:
             loop = asyncio.get_running_loop()
@@ -366,20 +446,31 @@ async def post_flow() -> None:
 
     # 8. Copy approved images + title to temp/post, clean up generated/
     print("\n[Pipeline] Finalizing post with approved images...")
-    _finalize_post(approved_images)
+    # Blocking rmtree + copy batch; keep it off the event loop.
+    await asyncio.to_thread(_finalize_post, approved_images)
 
     # 9. Post to Instagram
-    from .discord_utils import send_discord_message, send_discord_file
+    from .discord_utils import (
+        send_discord_file,
+        send_discord_message,
+        with_discord_client,
+    )
 
     post_dir = _get_post_dir()
-    post_images: list[str] = []
-    if post_dir.exists():
-        title_post = post_dir / "title-post.png"
-        if title_post.exists():
-            post_images.append(str(title_post))
-        for f in sorted(post_dir.iterdir()):
-            if f.suffix.lower() in {".png", ".jpg", ".jpeg"} and f.name != "title-post.png":
-                post_images.append(str(f))
+    # One scan: keep only image names, sort those, put the title first.
+    try:
+        with os.scandir(post_dir) as entries:
+            image_names = sorted(
+                e.name for e in entries
+                if os.path.splitext(e.name)[1].lower() in _IMAGE_SUFFIXES
+            )
+    except FileNotFoundError:
+        image_names = []
+    post_images = [
+        str(post_dir / name) for name in image_names if name == "title-post.png"
+    ] + [
+        str(post_dir / name) for name in image_names if name != "title-post.png"
+    ]
 
     if post_images:
         cfg = get_config()
@@ -388,33 +479,46 @@ async def post_flow() -> None:
         caption = cfg.format_caption(formatted_date)
 
         print(f"\n[Pipeline] Uploading {len(post_images)} image(s) to Instagram...")
-        await send_discord_message(
-            f"⏳ **Uploading {len(post_images)} image(s) to Instagram...**"
-        )
-
-        try:
-            # TODO: Add location
-            print(f"[Pipeline] images: \n{chr(10).join(post_images)}")
-            await upload_media(
-                image_sources=post_images,
-                caption=caption,
-            )
-            _cleanup_generated_images()
-            print("[Pipeline] Instagram upload completed.")
-            await send_discord_message(
-                f"✅ **Instagram upload completed!** ({len(post_images)} images)"
-            )
-        except Exception as exc:
-            print(f"[Pipeline] Instagram upload FAILED: {exc}")
-            await send_discord_message(
-                f"❌ **Instagram upload failed:** {exc}"
-            )
-            # Send debug screenshot if one was captured
-            screenshot = _get_temp_dir() / "debug-screenshot.png"
-            if screenshot.exists():
-                await send_discord_file(
-                    screenshot, "🖥️ **Debug screenshot at time of failure:**"
+        # One Discord login for all status messages instead of a fresh
+        # connect/disconnect per send.
+        async with with_discord_client() as channel:
+            # The status message is informational; let it overlap the upload
+            # and settle it before the result message so the two arrive in
+            # order (gather with return_exceptions so a failed send can't
+            # mask the upload outcome).
+            status_task = asyncio.create_task(send_discord_message(
+                f"⏳ **Uploading {len(post_images)} image(s) to Instagram...**",
+                channel,
+            ))
+
+            try:
+                # TODO: Add location
+                print(f"[Pipeline] images: \n{chr(10).join(post_images)}")
+                await upload_media(
+                    image_sources=post_images,
+                    caption=caption,
+                )
+                await asyncio.to_thread(_cleanup_generated_images)
+                print("[Pipeline] Instagram upload completed.")
+                await asyncio.gather(status_task, return_exceptions=True)
+                await send_discord_message(
+                    f"✅ **Instagram upload completed!** ({len(post_images)} images)",
+                    channel,
+                )
+            except Exception as exc:
+                print(f"[Pipeline] Instagram upload FAILED: {exc}")
+                await asyncio.gather(status_task, return_exceptions=True)
+                await send_discord_message(
+                    f"❌ **Instagram upload failed:** {exc}", channel
                 )
+                # Send debug screenshot if one was captured
+                screenshot = _get_temp_dir() / "debug-screenshot.png"
+                if screenshot.exists():
+                    await send_discord_file(
+                        screenshot,
+                        "🖥️ **Debug screenshot at time of failure:**",
+                        channel,
+                    )
     else:
         print("[Pipeline] No images in post folder; skipping Instagram upload.")
         await send_discord_message(
@@ -0,0 +1,76 @@
+"""
+Long-lived async Playwright runtime shared across workflow invocations.
+
+Chromium startup costs a couple of seconds; callers that render in bursts
+(image generation, scheduled reruns in one process) shouldn't pay it per
+call. The runtime owns a dedicated background event loop so the browser
+survives between the short-lived ``asyncio.run`` loops the sync call sites
+use, and tears everything down via ``atexit``.
+"""
+import asyncio
+import atexit
+import threading
+
+from playwright.async_api import async_playwright
+
+_loop = None
+_thread = None
+_playwright = None
+_browser = None
+_browser_lock = None
+_startup_lock = threading.Lock()
+
+
+def _ensure_loop() -> asyncio.AbstractEventLoop:
+    global _loop, _thread, _browser_lock
+    with _startup_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            _browser_lock = asyncio.Lock()
+            _thread = threading.Thread(
+                target=_loop.run_forever, name="playwright-runtime", daemon=True)
+            _thread.start()
+            atexit.register(shutdown)
+    return _loop
+
+
+def run(coro):
+    """Run *coro* on the runtime loop and return its result (blocking)."""
+    loop = _ensure_loop()
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+async def get_shared_browser():
+    """Return the shared headless Chromium, launching it on first use.
+
+    Must be awaited on the runtime loop (i.e. from a coroutine passed to
+    ``run``), so the browser stays bound to a loop that never closes.
+    """
+    global _playwright, _browser
+    async with _browser_lock:
+        if _browser is None:
+            _playwright = await async_playwright().start()
+            _browser = await _playwright.chromium.launch(headless=True)
+    return _browser
+
+
+def shutdown() -> None:
+    """Close the shared browser and stop the runtime loop."""
+    global _playwright, _browser
+    if _loop is None:
+        return
+
+    async def _close() -> None:
+        global _playwright, _browser
+        if _browser is not None:
+            await _browser.close()
+            _browser = None
+        if _playwright is not None:
+            await _playwright.stop()
+            _playwright = None
+
+    try:
+        asyncio.run_coroutine_threadsafe(_close(), _loop).result(timeout=10)
+    except Exception:
+        pass
+    _loop.call_soon_threadsafe(_loop.stop)
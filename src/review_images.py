@@ -17,21 +17,20 @@ Legacy single-shot entry point ``run_review`` is kept for backwards compat.
 from __future__ import annotations
 
 import asyncio
-import json
+import io
 import os
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-import discord
-from dotenv import load_dotenv
-
-from .discord_utils import load_discord_config, send_discord_message, send_discord_file
+from .jsonio import dump_json, load_json
 
 # ── constants ─────────────────────────────────────────────────────────────────
 
-IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg"}
+IMAGE_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg"})
 MAX_POLL_ANSWERS = 10  # Discord hard limit
+MAX_FILES_PER_MESSAGE = 10  # Discord attachment limit per message
 POLL_STATE_FILE = "poll-state.json"
+RESULTS_FILE = "image-review.json"
 SKIP_UPLOAD_LABEL = "❌ Don't upload this post"
 
 
@@ -40,12 +39,33 @@ SKIP_UPLOAD_LABEL = "❌ Don't upload this post"
 
 def _load_config() -> dict:
     """Alias for the shared Discord config loader."""
+    from .discord_utils import load_discord_config
+
     return load_discord_config()
 
 
 # ── helpers ───────────────────────────────────────────────────────────────────
 
 
+def _scandir_files(root: str):
+    """Recursively yield file ``DirEntry`` objects under ``root``.
+
+    Uses ``os.scandir`` so file-type checks come from the cached directory
+    entry instead of a stat() per path; symlinks are skipped to avoid loops.
+    """
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_symlink():
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scandir_files(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+    except PermissionError:
+        return
+
+
 def _collect_images(images_dir: Path) -> list[Path]:
     """Return all generated image files sorted alphabetically.
 
@@ -54,22 +74,90 @@ def _collect_images(images_dir: Path) -> list[Path]:
     """
     if not images_dir.exists():
         return []
-    return sorted(
-        p
-        for p in images_dir.rglob("*")
-        if p.is_file()
-        and p.suffix.lower() in IMAGE_EXTENSIONS
-        and not p.stem.startswith("title-post")
-    )
+    images = []
+    for entry in _scandir_files(str(images_dir)):
+        name = entry.name
+        if name.startswith("title-post"):
+            continue
+        dot = name.rfind(".")
+        if dot >= 0 and name[dot:].lower() in IMAGE_EXTENSIONS:
+            images.append(Path(entry.path))
+    images.sort()
+    return images
 
 
 def _relative(path: Path, base: Path) -> str:
     return path.relative_to(base).as_posix()
 
 
+def _utc_now() -> datetime:
+    """Aware UTC now; ``utcnow()`` is deprecated and builds a naive value."""
+    return datetime.now(timezone.utc)
+
+
+def _iso_z(moment: datetime) -> str:
+    """ISO timestamp with the ``Z`` suffix the state files have always used."""
+    return moment.isoformat().replace("+00:00", "Z")
+
+
+async def _send_image_batches(
+    channel: discord.TextChannel,
+    images: list[Path],
+    rels: list[str],
+) -> None:
+    """Post the images in batches of up to 10 attachments per message.
+
+    One round-trip per batch instead of one per image; messages stay in
+    sorted order so attachments line up with the numbered poll answers.
+    File contents are read on the threadpool, and the next batch's reads
+    are kicked off before the current send so disk I/O hides behind the
+    HTTP round-trip (one batch of lookahead bounds memory use).
+    """
+    import discord
+
+    total = len(images)
+    chunks = [
+        images[start : start + MAX_FILES_PER_MESSAGE]
+        for start in range(0, total, MAX_FILES_PER_MESSAGE)
+    ]
+
+    def _read_chunk(chunk: list[Path]) -> asyncio.Future:
+        return asyncio.gather(
+            *(asyncio.to_thread(p.read_bytes) for p in chunk)
+        )
+
+    pending = _read_chunk(chunks[0]) if chunks else None
+    for index, chunk in enumerate(chunks):
+        contents = await pending
+        pending = (
+            _read_chunk(chunks[index + 1]) if index + 1 < len(chunks) else None
+        )
+        start = index * MAX_FILES_PER_MESSAGE
+        listing = "\n".join(
+            f"{start + i}. {rel}"
+            for i, rel in enumerate(rels[start : start + len(chunk)], 1)
+        )
+        await channel.send(
+            f"**Images {start + 1}-{start + len(chunk)}/{total}**\n{listing}",
+            files=[
+                discord.File(io.BytesIO(data), filename=p.name)
+                for p, data in zip(chunk, contents)
+            ],
+        )
+
+
 def _short_label(text: str, limit: int = 55) -> str:
-    """Truncate to fit Discord's poll-answer character limit."""
-    return text if len(text) <= limit else text[: limit - 1] + "…"
+    """Truncate to fit Discord's poll-answer character limit.
+
+    Over-long labels keep their "N. " index prefix and the *tail* of the
+    path — that's where the venue/event slug lives, so the reviewer still
+    sees which image the answer refers to.
+    """
+    if len(text) <= limit:
+        return text
+    dot = text.find(". ")
+    prefix = text[: dot + 2] if 0 <= dot <= 4 else ""
+    return f"{prefix}…{text[-(limit - len(prefix) - 1):]}"
 
 
 def _save_poll_state(
@@ -89,7 +177,7 @@ def _save_poll_state(
         "image_paths": image_paths,
         "sent_at": sent_at,
     }
-    out.write_text(json.dumps(state, ensure_ascii=False, indent=2), encoding="utf-8")
+    dump_json(state, str(out))
     return out
 
 
@@ -99,7 +187,7 @@ def _load_poll_state(temp_dir: Path) -> dict:
         raise FileNotFoundError(
             f"No poll state found at {path}. Did you run the morning script first?"
         )
-    return json.loads(path.read_text(encoding="utf-8"))
+    return load_json(path)
 
 
 def _persist_results(
@@ -111,18 +199,16 @@ def _persist_results(
     finished_at: datetime,
 ) -> Path:
     temp_dir.mkdir(parents=True, exist_ok=True)
-    out = temp_dir / "image-review.json"
+    out = temp_dir / RESULTS_FILE
     record = {
         "approved_images": approved,
-        "started_at": started_at.isoformat() + "Z",
-        "finished_at": finished_at.isoformat() + "Z",
+        "started_at": _iso_z(started_at),
+        "finished_at": _iso_z(finished_at),
         "channel_id": config["channel_id"],
         "reviewer_id": config["reviewer_id"],
         "timed_out": timed_out,
     }
-    out.write_text(
-        json.dumps(record, ensure_ascii=False, indent=2), encoding="utf-8"
-    )
+    dump_json(record, str(out))
     return out
 
 
@@ -136,6 +222,8 @@ async def _do_send_poll(
     temp_dir: Path,
 ) -> None:
     """Post images + Discord poll, save state, and return immediately."""
+    import discord
+
     channel = client.get_channel(config["channel_id"])
     if channel is None:
         channel = await client.fetch_channel(config["channel_id"])
@@ -149,14 +237,12 @@ async def _do_send_poll(
         return
 
     total = len(images)
+    # Relative paths are reused by the batch listing, the poll answers and
+    # the saved state, so compute them once up front.
+    rels = [_relative(p, images_dir) for p in images]
 
-    # 1. Post each image ──────────────────────────────────────────────────────
-    for idx, path in enumerate(images, 1):
-        rel = _relative(path, images_dir)
-        await channel.send(
-            f"**Image {idx}/{total}** — {rel}",
-            file=discord.File(str(path), filename=path.name),
-        )
+    # 1. Post the images, batched to Discord's attachment limit ───────────────
+    await _send_image_batches(channel, images, rels)
 
     # 2. Build and send native Discord poll ───────────────────────────────────
     poll = discord.Poll(
@@ -164,8 +250,7 @@ async def _do_send_poll(
         duration=timedelta(hours=24),
         multiple=True,
     )
-    for idx, path in enumerate(images, 1):
-        rel = _relative(path, images_dir)
+    for idx, rel in enumerate(rels, 1):
         poll.add_answer(text=_short_label(f"{idx}. {rel}"))
 
     # Last option: skip the upload entirely
@@ -181,19 +266,20 @@ async def _do_send_poll(
     )
 
     # 3. Save state for the post script ───────────────────────────────────────
-    rel_paths = [_relative(p, images_dir) for p in images]
     state_path = _save_poll_state(
         temp_dir,
         channel_id=config["channel_id"],
         poll_message_id=poll_msg.id,
-        image_paths=rel_paths,
-        sent_at=datetime.utcnow().isoformat() + "Z",
+        image_paths=rels,
+        sent_at=_iso_z(_utc_now()),
     )
     print(f"[Review] Poll sent ({total} images). State saved to {state_path}")
 
 
 async def send_poll(images_dir: Path, temp_dir: Path) -> None:
     """Public entry point for the morning script."""
+    import discord
+
     config = _load_config()
     done = asyncio.Event()
 
@@ -226,11 +312,18 @@ async def _do_collect_results(
     temp_dir: Path,
 ) -> list[str] | None:
     """End the poll, read votes, return approved paths or None to skip upload."""
-    state = _load_poll_state(temp_dir)
+    import discord
 
-    channel = client.get_channel(state["channel_id"])
+    # The poll was sent to config["channel_id"], so the channel handle and
+    # the state file can be fetched/read concurrently instead of serially.
+    state_task = asyncio.ensure_future(asyncio.to_thread(_load_poll_state, temp_dir))
+    channel = client.get_channel(config["channel_id"])
     if channel is None:
-        channel = await client.fetch_channel(state["channel_id"])
+        state, channel = await asyncio.gather(
+            state_task, client.fetch_channel(config["channel_id"])
+        )
+    else:
+        state = await state_task
     if not isinstance(channel, discord.TextChannel):
         print(f"[Review] Channel {state['channel_id']} is not a text channel.")
         return []
@@ -246,20 +339,16 @@ async def _do_collect_results(
         poll_msg = await channel.fetch_message(state["poll_message_id"])
         ended_poll = poll_msg.poll
 
-    # Read votes ──────────────────────────────────────────────────────────────
-    answers_list = list(ended_poll.answers)
-    # The last answer is the "Don't upload" option
-    skip_answer = answers_list[-1] if answers_list else None
-    skip_upload = (
-        skip_answer is not None
-        and skip_answer.vote_count
-        and skip_answer.vote_count > 0
-    )
-
+    # Read votes in one pass; the "Don't upload" option is recognised by
+    # its label rather than by position, so no list copy or slice needed.
+    skip_upload = False
     approved: list[str] = []
     any_votes = False
-    for i, answer in enumerate(answers_list[:-1]):  # exclude skip option
-        if answer.vote_count and answer.vote_count > 0:
+    for i, answer in enumerate(ended_poll.answers):
+        voted = bool(answer.vote_count and answer.vote_count > 0)
+        if answer.text == SKIP_UPLOAD_LABEL:
+            skip_upload = voted
+        elif voted:
             any_votes = True
             if i < len(image_paths):
                 approved.append(image_paths[i])
@@ -270,13 +359,12 @@ async def _do_collect_results(
         approved = list(image_paths)
 
     total = len(image_paths)
-    finish_time = datetime.utcnow()
-    start_time = datetime.fromisoformat(state["sent_at"].rstrip("Z"))
+    finish_time = _utc_now()
+    start_time = datetime.fromisoformat(state["sent_at"].replace("Z", "+00:00"))
 
-    # Persist & announce ──────────────────────────────────────────────────────
-    record_path = _persist_results(
-        approved, False, config, temp_dir, start_time, finish_time
-    )
+    # Persist & announce; the record path is deterministic, so the disk
+    # write and the Discord send can run concurrently.
+    record_path = temp_dir / RESULTS_FILE
 
     if skip_upload:
         summary = "Upload cancelled via poll."
@@ -285,9 +373,15 @@ async def _do_collect_results(
     else:
         summary = "No images were approved."
 
-    await channel.send(
-        f"**Poll complete** — {summary}\n"
-        f"Record saved to `{record_path}`."
+    await asyncio.gather(
+        asyncio.to_thread(
+            _persist_results,
+            approved, False, config, temp_dir, start_time, finish_time,
+        ),
+        channel.send(
+            f"**Poll complete** — {summary}\n"
+            f"Record saved to `{record_path}`."
+        ),
     )
 
     # Return None to signal "don't upload at all"
@@ -304,6 +398,8 @@ async def collect_poll_results(images_dir: Path, temp_dir: Path) -> list[str] |
     Returns a list of approved relative paths, or ``None`` if the
     \"Don't upload\" option was voted.
     """
+    import discord
+
     config = _load_config()
     result: list[str] | None = []
     done = asyncio.Event()
@@ -337,6 +433,8 @@ async def run_review(images_dir: Path, temp_dir: Path) -> list[str]:
 
     Kept for backwards compatibility with the monolithic ``ensure_main_flow``.
     """
+    import discord
+
     config = _load_config()
     result: list[str] = []
     ready_event = asyncio.Event()
@@ -374,6 +472,8 @@ async def _run_poll_legacy(
     temp_dir: Path,
 ) -> list[str]:
     """Original single-shot poll: post, wait, end, return."""
+    import discord
+
     channel = client.get_channel(config["channel_id"])
     if channel is None:
         channel = await client.fetch_channel(config["channel_id"])
@@ -387,22 +487,17 @@ async def _run_poll_legacy(
         return []
 
     total = len(images)
-    start_time = datetime.utcnow()
+    rels = [_relative(p, images_dir) for p in images]
+    start_time = _utc_now()
 
-    for idx, path in enumerate(images, 1):
-        rel = _relative(path, images_dir)
-        await channel.send(
-            f"**Image {idx}/{total}** — {rel}",
-            file=discord.File(str(path), filename=path.name),
-        )
+    await _send_image_batches(channel, images, rels)
 
     poll = discord.Poll(
         question="Select images to approve",
         duration=timedelta(hours=1),
         multiple=True,
     )
-    for idx, path in enumerate(images, 1):
-        rel = _relative(path, images_dir)
+    for idx, rel in enumerate(rels, 1):
         poll.add_answer(text=_short_label(f"{idx}. {rel}"))
 
     poll_msg = await channel.send(
@@ -444,28 +539,36 @@ async def _run_poll_legacy(
 
     approved: list[str] = []
     for i, answer in enumerate(ended_poll.answers):
-        if answer.vote_count and answer.vote_count > 0 and i < len(images):
-            approved.append(_relative(images[i], images_dir))
+        if answer.vote_count and answer.vote_count > 0 and i < len(rels):
+            approved.append(rels[i])
 
-    finish_time = datetime.utcnow()
+    finish_time = _utc_now()
 
-    record_path = _persist_results(
-        approved, timed_out, config, temp_dir, start_time, finish_time
-    )
+    record_path = temp_dir / RESULTS_FILE
     summary = (
         f"Approved {len(approved)}/{total} images."
         if approved
         else "No images were approved."
     )
-    await channel.send(
-        f"**Poll complete** — {summary}\n"
-        f"Record saved to `{record_path}`."
+    # Write the record on the threadpool while the summary send is in flight.
+    await asyncio.gather(
+        asyncio.to_thread(
+            _persist_results,
+            approved, timed_out, config, temp_dir, start_time, finish_time,
+        ),
+        channel.send(
+            f"**Poll complete** — {summary}\n"
+            f"Record saved to `{record_path}`."
+        ),
     )
 
     return approved
 
 
-# Re-export so existing ``from .review_images import send_discord_*`` still works
+# Re-export so existing ``from .review_images import send_discord_*`` still
+# works; resolved lazily so importing this module doesn't pull in discord.
+_DISCORD_REEXPORTS = ("send_discord_message", "send_discord_file")
+
 __all__ = [
     "send_poll",
     "collect_poll_results",
@@ -473,3 +576,12 @@ __all__ = [
     "send_discord_message",
     "send_discord_file",
 ]
+
+
+def __getattr__(name: str):
+    if name in _DISCORD_REEXPORTS:
+        from . import discord_utils
+
+        return getattr(discord_utils, name)
+    raise AttributeError(
+        f"module {__name__!r} has no attribute {name!r}")
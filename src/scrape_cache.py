@@ -0,0 +1,76 @@
+"""
+Scrape Cache - On-disk cache for crawled markdown + Gemini extractions.
+
+Entries are keyed by a hash of (url, scraping-config key, known date) so
+the same event URL is never crawled and sent to Gemini twice within the
+TTL window. Used by src/ai_scraper.py to skip both the crawl4ai run and
+the Gemini call on repeated runs of the same day (morning/post two-phase
+flow, run_process.py retries).
+"""
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_TTL_SECONDS = 24 * 3600
+
+_CACHE_PATH = Path(__file__).resolve().parents[1] / "temp" / "scrape-cache.sqlite3"
+_conn: Optional[sqlite3.Connection] = None
+
+
+def _get_conn() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _conn = sqlite3.connect(_CACHE_PATH, check_same_thread=False)
+        _conn.execute("PRAGMA journal_mode=WAL")
+        _conn.execute(
+            "CREATE TABLE IF NOT EXISTS scrape_cache ("
+            "  key TEXT PRIMARY KEY,"
+            "  markdown TEXT,"
+            "  detail TEXT,"
+            "  created_at REAL"
+            ")"
+        )
+        _conn.commit()
+    return _conn
+
+
+def make_key(url: str, config_key: str = "", known_date: str = "") -> str:
+    """Build the cache key for an event URL + its scraping config + date."""
+    raw = f"{url}|{config_key}|{known_date}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def get(key: str, ttl: int = DEFAULT_TTL_SECONDS) -> Optional[dict]:
+    """Return the cached EventDetail dict for *key*, or None on miss/expiry."""
+    conn = _get_conn()
+    row = conn.execute(
+        "SELECT detail, created_at FROM scrape_cache WHERE key = ?", (key,)
+    ).fetchone()
+    if row is None:
+        return None
+
+    detail_json, created_at = row
+    if time.time() - created_at > ttl:
+        conn.execute("DELETE FROM scrape_cache WHERE key = ?", (key,))
+        conn.commit()
+        return None
+
+    try:
+        return json.loads(detail_json)
+    except (TypeError, json.JSONDecodeError):
+        return None
+
+
+def put(key: str, markdown: str, detail: dict) -> None:
+    """Store the crawled markdown and extracted detail for *key*."""
+    conn = _get_conn()
+    conn.execute(
+        "INSERT OR REPLACE INTO scrape_cache (key, markdown, detail, created_at) "
+        "VALUES (?, ?, ?, ?)",
+        (key, markdown or "", json.dumps(detail, ensure_ascii=False), time.time()),
+    )
+    conn.commit()
@@ -1,14 +1,40 @@
 """
 Setup module - ensures all dependencies are installed and configured.
 """
+import glob
+import hashlib
+import re
 import subprocess
 import sys
 import os
+from pathlib import Path
+
+# Hash of the last requirements.txt that was successfully installed; lets
+# warm runs skip the multi-second pip resolve when nothing changed.
+_REQUIREMENTS_HASH_FILE = os.path.join("temp", ".requirements.hash")
 
 
 def check_python_packages(requirements_file: str) -> bool:
-    """Check and install required Python packages."""
+    """Check and install required Python packages.
+
+    pip re-resolves the whole dependency graph even when everything is
+    already satisfied, so the install is skipped when requirements.txt
+    hashes the same as on the last successful run.
+    """
     if requirements_file and os.path.exists(requirements_file):
+        with open(requirements_file, "rb") as f:
+            req_hash = hashlib.blake2b(f.read()).hexdigest()
+
+        project_root = os.path.dirname(requirements_file)
+        hash_path = os.path.join(project_root, _REQUIREMENTS_HASH_FILE)
+        try:
+            with open(hash_path, "r") as f:
+                if f.read().strip() == req_hash:
+                    print("[Setup] Python packages unchanged, skipping pip install.")
+                    return True
+        except OSError:
+            pass
+
         print("[Setup] Installing Python packages from requirements.txt...")
         result = subprocess.run(
             [sys.executable, "-m", "pip", "install", "-r", requirements_file],
@@ -17,6 +43,10 @@ def check_python_packages(requirements_file: str) -> bool:
         if result.returncode != 0:
             print(f"[Setup] ERROR installing packages: {result.stderr}")
             return False
+
+        os.makedirs(os.path.dirname(hash_path), exist_ok=True)
+        with open(hash_path, "w") as f:
+            f.write(req_hash)
         print("[Setup] Python packages installed successfully.")
     return True
 
@@ -25,6 +55,15 @@ def check_playwright() -> bool:
     """Check if Playwright browsers are installed."""
     try:
         print("[Setup] Checking Playwright installation...")
+        # An existing Chromium binary means a previous install finished;
+        # skip the subprocess (which re-checks the download) entirely.
+        chrome_glob = os.path.expanduser(
+            "~/.cache/ms-playwright/chromium-*/chrome-linux/chrome"
+        )
+        if glob.glob(chrome_glob):
+            print("[Setup] Playwright Chromium browser is ready.")
+            return True
+
         result = subprocess.run(
             [sys.executable, "-m", "playwright", "install", "chromium"],
             capture_output=True, text=True
@@ -39,28 +78,30 @@ def check_playwright() -> bool:
         return False
 
 
+# Matches a configured key in one pass: present and not the template value.
+_GEMINI_KEY_RE = re.compile(r"^GEMINI_API_KEY=(?!your_api_key_here)\S+", re.M)
+
+
 def check_env_file(project_root: str) -> bool:
     """Check if .env file exists with required keys."""
-    env_path = os.path.join(project_root, ".env")
-    if not os.path.exists(env_path):
+    env_path = Path(project_root) / ".env"
+    if not env_path.is_file():
         # Check parent directory
-        parent_env = os.path.join(os.path.dirname(project_root), ".env")
-        if os.path.exists(parent_env):
+        parent_env = env_path.parent.parent / ".env"
+        if parent_env.is_file():
             print(f"[Setup] Found .env in parent directory, using: {parent_env}")
             return True
         print(f"[Setup] WARNING: No .env file found at {env_path}")
         print("[Setup] Creating template .env file...")
-        with open(env_path, "w") as f:
-            f.write("GEMINI_API_KEY=your_api_key_here\n")
-            f.write("META_ACCESS_TOKEN=\n")
-            f.write("META_USER_ID=\n")
+        env_path.write_text(
+            "GEMINI_API_KEY=your_api_key_here\n"
+            "META_ACCESS_TOKEN=\n"
+            "META_USER_ID=\n"
+        )
         print(f"[Setup] Please edit {env_path} and add your GEMINI_API_KEY")
         return False
 
-    with open(env_path, "r") as f:
-        content = f.read()
-
-    if "GEMINI_API_KEY" not in content or "your_api_key_here" in content:
+    if not _GEMINI_KEY_RE.search(env_path.read_text(encoding="utf-8")):
         print("[Setup] WARNING: GEMINI_API_KEY not configured in .env file")
         return False
 
@@ -68,13 +109,11 @@ def check_env_file(project_root: str) -> bool:
     return True
 
 
-
 def ensure_temp_dirs(project_root: str):
     """Create necessary temp directories."""
-    temp_dir = os.path.join(project_root, "temp")
-    images_dir = os.path.join(temp_dir, "images")
-    os.makedirs(temp_dir, exist_ok=True)
-    os.makedirs(images_dir, exist_ok=True)
+    temp_dir = Path(project_root) / "temp"
+    # One mkdir chain creates temp/ and temp/images/ together.
+    (temp_dir / "images").mkdir(parents=True, exist_ok=True)
     print(f"[Setup] Temp directories ready: {temp_dir}")
 
 
@@ -2,10 +2,22 @@
 URL Parser - Maps URLs to their required scraping configuration.
 Reused from src/url_parser.py
 """
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from functools import lru_cache
 from typing import Optional, TypedDict
-from urllib.parse import urlparse
 import logging
 
+import yaml
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _YamlLoader
+
+logger = logging.getLogger(__name__)
+
 
 class EventSelectors(TypedDict, total=False):
     title: str
@@ -17,86 +29,118 @@ class EventSelectors(TypedDict, total=False):
     image_url: str
 
 
+# Configs are plain data we build ourselves and treat as read-only, so a
+# frozen slots dataclass fits: no per-instance __dict__, C-level attribute
+# access, and accidental mutation of the shared table entries raises.
+@dataclass(slots=True, frozen=True)
 class ScrapingConfig:
-    def __init__(self, actions: list = None, selectors: EventSelectors = None):
-        self.actions = actions or []
-        self.selectors = selectors or {}
-
-
-def parse_url_config(url: str) -> ScrapingConfig:
-    parsed = urlparse(url)
-    domain = parsed.netloc.lower()
-    if domain.startswith('www.'):
-        domain = domain[4:]
-    print(f"Domain: {domain}")
-
-    if domain == 'artbar.club':
-        return ScrapingConfig(actions=[], selectors={})
-
-    elif domain == "facebook.com":
-        return ScrapingConfig(
-            actions=[
-                {"type": "wait", "duration": 3},
-                {"type": "click_text", "text": "See more"},
-                {"type": "wait", "duration": 1}
-            ],
-            selectors={"image_url": "div[aria-label='Event photo'] img"}
+    actions: tuple = ()
+    selectors: EventSelectors = field(default_factory=dict)
+
+    @property
+    def cache_key(self) -> str:
+        """Stable string key for memoizing work derived from this config."""
+        return json.dumps(
+            {"actions": self.actions, "selectors": self.selectors},
+            sort_keys=True,
         )
 
-    elif domain == "fairplay.events":
-        return ScrapingConfig(actions=[], selectors={})
 
-    elif domain == "goout.net":
-        return ScrapingConfig(actions=[], selectors={
-            "description": "div.markdown",
-            "image_url": ".image-header-wrapper img.loaded"
-        })
+# One shared instance for every domain without a specific config; like the
+# table entries it is read-only, so default constructions are free.
+_DEFAULT_CONFIG = ScrapingConfig()
 
-    elif domain == 'eventlook.cz':
-        return ScrapingConfig(actions=[], selectors={"image_url": "span.wrapper > img"})
 
-    elif domain == 'tootoot.fm':
-        return ScrapingConfig(actions=[], selectors={"image_url": "div.main-img"})
+_DOMAINS_FILE = Path(__file__).resolve().parents[1] / "configs" / "domains.yaml"
 
-    elif domain == 'ticketportal.cz':
-        return ScrapingConfig(actions=[], selectors={"image_url": "div.detail-header > img"})
 
-    elif domain == 'sono.cz':
-        return ScrapingConfig(actions=[], selectors={"image_url": "div.featured-image > img"})
+def _load_domain_configs() -> dict:
+    """Build the domain dispatch table from ``configs/domains.yaml``.
 
-    elif domain == 'kabinetmuz.cz':
-        return ScrapingConfig(actions=[], selectors={"image_url": "div.detail__img"})
+    The mapping is pure data (selectors and browser actions per venue
+    site), so it lives next to the city configs where it can be edited
+    without touching code. Loaded once at import into shared read-only
+    ScrapingConfig instances; the per-call dispatch stays a dict probe.
+    """
+    with open(_DOMAINS_FILE, "r", encoding="utf-8") as fh:
+        raw = yaml.load(fh, Loader=_YamlLoader) or {}
+    return {
+        domain: ScrapingConfig(
+            actions=tuple((entry or {}).get("actions") or ()),
+            selectors=(entry or {}).get("selectors") or {},
+        )
+        for domain, entry in raw.items()
+    }
+
+
+_DOMAIN_CONFIGS: dict = _load_domain_configs()
+
+
+@lru_cache(maxsize=256)
+def _config_for_domain(domain: str) -> ScrapingConfig:
+    """Config for a normalized domain; memoized since domains repeat a lot.
+
+    Caching on the domain (not the full URL) keeps the hit rate high and
+    also means the unknown-domain default is built and logged once per
+    domain instead of once per URL.
+    """
+    config = _DOMAIN_CONFIGS.get(domain)
+    if config is None:
+        # Subdomain fallthrough: m.facebook.com or events.goout.net should
+        # route to the registered parent domain, not the defaults. Walk the
+        # label suffixes; the lru_cache above means each unique domain pays
+        # this at most once.
+        suffix = domain
+        while (dot := suffix.find(".")) != -1:
+            suffix = suffix[dot + 1:]
+            config = _DOMAIN_CONFIGS.get(suffix)
+            if config is not None:
+                return config
+        logger.info("No specific config found for %s, using defaults", domain)
+        config = _DEFAULT_CONFIG
+    return config
+
+
+def _extract_domain(url: str) -> str:
+    """Pull the normalized host out of a URL with plain string scans.
+
+    urlparse builds a full six-field ParseResult (scheme, params, query,
+    fragment, ...) that this dispatch immediately throws away; two finds
+    and the userinfo/port strips cover everything the lookup needs.
+    """
+    scheme_end = url.find("://")
+    start = scheme_end + 3 if scheme_end != -1 else 0
+    end = url.find("/", start)
+    netloc = url[start:end] if end != -1 else url[start:]
+
+    at = netloc.rfind("@")
+    if at != -1:
+        netloc = netloc[at + 1:]
+    colon = netloc.find(":")
+    if colon != -1:
+        netloc = netloc[:colon]
+
+    # str.lower() always allocates a fresh string, but hosts are almost
+    # always lowercase already; islower() is a single allocation-free scan.
+    if not netloc.islower():
+        netloc = netloc.lower()
+    return netloc[4:] if netloc.startswith("www.") else netloc
 
-    elif domain == 'perpetuumklub.cz':
-        return ScrapingConfig(actions=[], selectors={"image_url": "div.event_image > img"})
 
-    elif domain == 'metromusic.cz':
-        return ScrapingConfig(actions=[], selectors={"image_url": "div.teaser.teaser-detail"})
+def parse_url_config(url: str) -> ScrapingConfig:
+    domain = _extract_domain(url)
+    logger.debug("Domain: %s", domain)
 
-    elif domain == 'fleda.cz':
-        return ScrapingConfig(
-            actions=[
-                {"type": "wait", "duration": 2},
-                {"type": "click", "selector": "div.program-detail > div.clearfix > div.img > div > a > img"},
-                {"type": "wait", "duration": 2},
-            ],
-            selectors={"image_url": "img.fancybox-image"}
-        )
+    return _config_for_domain(domain)
 
-    elif domain == 'smsticket.cz':
-        return ScrapingConfig(
-            actions=[
-                {"type": "wait", "duration": 2},
-                {"type": "click", "selector": "div.poster > img"},
-                {"type": "wait", "duration": 2},
-            ],
-            selectors={"image_url": "div.featherlight-content > img", "date": ".date-place"}
-        )
 
-    elif domain == 'ra.co':
-        return ScrapingConfig(actions=[], selectors={
-            "image_url": "section[data-tracking-id='event-detail-description'] ul li img"
-        })
+def parse_url_configs(urls) -> list:
+    """Dispatch a batch of URLs in one comprehension.
 
-    logging.info(f"No specific config found for {domain}, using defaults")
-    return ScrapingConfig()
+    Same results as calling :func:`parse_url_config` per URL (including
+    subdomain fallthrough), minus the per-call frame and debug-log
+    overhead — the loop stays in the C evaluation loop.
+    """
+    config_for = _config_for_domain
+    extract = _extract_domain
+    return [config_for(extract(url)) for url in urls]